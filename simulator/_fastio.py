@@ -0,0 +1,74 @@
+# simulator/_fastio.py
+"""
+Optional native CSV readers and writers, switched on with SIM_FAST_IO=1.
+Falls back polars -> pyarrow -> plain pandas depending on what is installed.
+"""
+from __future__ import annotations
+
+import os
+
+import pandas as pd
+
+try:  # optional: Rust CSV reader
+    import polars as pl
+except ImportError:  # pragma: no cover - depends on environment
+    pl = None
+
+try:  # optional: multi-threaded Arrow CSV parser (pandas engine="pyarrow")
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    _HAS_PYARROW = True
+except ImportError:  # pragma: no cover - depends on environment
+    _HAS_PYARROW = False
+
+# Rows per batch when filtering a CSV on read
+_CHUNK_ROWS = 250_000
+
+
+def fast_io_enabled() -> bool:
+    return os.environ.get("SIM_FAST_IO", "") == "1"
+
+
+def read_csv(path: str | os.PathLike) -> pd.DataFrame:
+    if fast_io_enabled():
+        if pl is not None:
+            return pl.read_csv(path).to_pandas(use_pyarrow_extension_array=True)
+        if _HAS_PYARROW:
+            return pd.read_csv(path, engine="pyarrow")
+    return pd.read_csv(path)
+
+
+def write_csv(df: pd.DataFrame, path: str | os.PathLike) -> None:
+    """
+    df.to_csv(path, index=False). The native writers give the same values but not the same
+    text (strings are quoted, whole floats lose their ".0"), hence also behind SIM_FAST_IO.
+    """
+    if fast_io_enabled():
+        if _HAS_PYARROW:
+            pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+            return
+        if pl is not None:
+            pl.from_pandas(df).write_csv(path)
+            return
+    df.to_csv(path, index=False)
+
+
+def read_csv_where(path: str | os.PathLike, column: str, value: str) -> pd.DataFrame:
+    """
+    Rows whose `column` equals `value` (compared as text), filtered batch by batch so the
+    whole file is never held in memory. A file without `column` comes back unfiltered.
+    """
+    if fast_io_enabled() and _HAS_PYARROW:
+        reader = pacsv.open_csv(path, convert_options=pacsv.ConvertOptions(column_types={column: pa.string()}))
+        if reader.schema.get_field_index(column) < 0:
+            return reader.read_all().to_pandas()
+        batches = [b.filter(pc.equal(b.column(column), value)) for b in reader]
+        return pa.Table.from_batches(batches, schema=reader.schema).to_pandas()
+
+    parts = []
+    for chunk in pd.read_csv(path, dtype={column: str}, chunksize=_CHUNK_ROWS):
+        parts.append(chunk[chunk[column] == value] if column in chunk.columns else chunk)
+    if not parts:
+        return pd.read_csv(path)
+    return pd.concat(parts, ignore_index=True)
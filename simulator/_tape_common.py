@@ -0,0 +1,71 @@
+# simulator/_tape_common.py
+"""
+Sector/regime/event tables and the samplers over them, shared by the daily tape
+(market_tape) and the hourly tape (live_tape) so both draw from the same distributions.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from news_generator.synthetic_news import NEWS_EVENT_TYPES
+
+SECTORS = ["Tech", "Financials", "Consumer", "Industrials", "Energy", "Healthcare", "Comm", "Speculative"]
+
+REGIMES = {
+    "bull":     {"mu": 0.0006, "sigma": 0.010},
+    "sideways": {"mu": 0.0001, "sigma": 0.008},
+    "bear":     {"mu": -0.0006, "sigma": 0.012},
+    "crisis":   {"mu": -0.0012, "sigma": 0.025},
+}
+
+REGIME_TRANSITIONS = {
+    "bull":     {"bull": 0.92, "sideways": 0.06, "bear": 0.015, "crisis": 0.005},
+    "sideways": {"bull": 0.10, "sideways": 0.82, "bear": 0.06, "crisis": 0.02},
+    "bear":     {"bull": 0.06, "sideways": 0.18, "bear": 0.70, "crisis": 0.06},
+    "crisis":   {"bull": 0.05, "sideways": 0.15, "bear": 0.35, "crisis": 0.45},
+}
+
+MACRO_HEADLINES = {
+    "Inflation cools": 0.16,
+    "Inflation spikes": 0.14,
+    "Jobs surprise": 0.18,
+    "Rates repriced": 0.20,
+    "Geopolitical tension": 0.16,
+    "Soft landing talk": 0.16,
+}
+
+REGIME_IDX = {r: i for i, r in enumerate(REGIMES)}
+EVENT_TYPES = list(NEWS_EVENT_TYPES.keys())
+
+def _cdf(weights) -> np.ndarray:
+    # same normalization as Generator.choice(p=...), so draws match it exactly
+    cdf = np.cumsum(np.asarray(weights, dtype=float) / np.sum(weights))
+    return cdf / cdf[-1]
+
+# Static distributions sampled as keys[searchsorted(cdf, u)]
+_REGIME_KEYS = {r: list(d.keys()) for r, d in REGIME_TRANSITIONS.items()}
+_REGIME_CDFS = {r: _cdf(list(d.values())) for r, d in REGIME_TRANSITIONS.items()}
+MACRO_KEYS = list(MACRO_HEADLINES.keys())
+MACRO_CDF = _cdf(list(MACRO_HEADLINES.values()))
+
+def sample_cdf(rng: np.random.Generator, keys: list, cdf: np.ndarray) -> str:
+    return keys[int(cdf.searchsorted(rng.random(), side="right"))]
+
+def next_regime(rng: np.random.Generator, current: str) -> str:
+    return sample_cdf(rng, _REGIME_KEYS[current], _REGIME_CDFS[current])
+
+def build_event_probs() -> np.ndarray:
+    """
+    Normalized event-type probabilities, shape (len(SECTORS), len(REGIMES), len(EVENT_TYPES)).
+    """
+    is_meme = np.array(["meme" in et for et in EVENT_TYPES])
+    is_macro = np.array(["macro_" in et for et in EVENT_TYPES])
+    is_crisis_hit = np.isin(EVENT_TYPES, ["macro_headwind", "regulatory_risk", "lawsuit", "earnings_miss"])
+
+    w = np.ones((len(SECTORS), len(REGIMES), len(EVENT_TYPES)), dtype=float)
+    w[SECTORS.index("Speculative"), :, is_meme] *= 2.2
+    w[SECTORS.index("Energy"), :, is_macro] *= 1.6
+    w[:, REGIME_IDX["crisis"], is_crisis_hit] *= 1.5
+    return w / w.sum(axis=-1, keepdims=True)
+
+EVENT_PROBS = build_event_probs()
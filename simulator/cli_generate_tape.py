@@ -2,7 +2,10 @@
 from __future__ import annotations
 
 import argparse
+import json
+import os
 from pathlib import Path
+from typing import Any, Dict
 import yaml
 
 from .market_tape import TapeConfig, generate_market_tape, save_market_tape
@@ -13,10 +16,44 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--config", type=str, default="simulator/configs/full_87.yaml", help="YAML config path")
     return p.parse_args()
 
+def _load_yaml_cached(path: str) -> Dict[str, Any]:
+    """
+    Load a YAML config, reusing a JSON sidecar (<path>.cache.json) when it was
+    written for the same mtime+size of the YAML file.
+
+    Sidecar layout: line 1 is the {"mtime", "size"} header, line 2 the config.
+    """
+    st = os.stat(path)
+    header = {"mtime": st.st_mtime, "size": st.st_size}
+    cache_path = path + ".cache.json"
+
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            if json.loads(f.readline()) == header:
+                return json.loads(f.readline())
+    except (OSError, ValueError):
+        pass
+
+    with open(path, "r", encoding="utf-8") as f:
+        cfg = yaml.safe_load(f) or {}
+
+    try:
+        payload = json.dumps(header) + "\n" + json.dumps(cfg) + "\n"
+    except (TypeError, ValueError):
+        return cfg  # e.g. unquoted YAML dates; not representable in JSON
+
+    tmp = cache_path + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp, cache_path)
+    except OSError:
+        pass  # cache is best-effort (e.g. read-only checkout)
+    return cfg
+
 def main() -> None:
     args = parse_args()
-    with open(args.config, "r", encoding="utf-8") as f:
-        cfg_y = yaml.safe_load(f) or {}
+    cfg_y = _load_yaml_cached(args.config)
 
     # Merge YAML into TapeConfig with sensible defaults
     tape_cfg = TapeConfig(
@@ -3,19 +3,48 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
+import numpy as np
 import pandas as pd
 
+try:  # optional: C JSON codec
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+try:  # optional: multi-threaded Arrow CSV parser
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pragma: no cover - depends on environment
+    pa = None
+    pacsv = None
+
 
 def ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
 def write_json(path: str, obj: Any) -> None:
+    """
+    Write via a temp file + os.replace so the dashboard never reads a
+    half-written snapshot.
+    """
     ensure_dir(os.path.dirname(path))
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(obj, f, ensure_ascii=False, indent=2)
+    tmp = path + ".tmp"
+    if orjson is not None:
+        opts = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        data = orjson.dumps(obj, option=opts)
+        with open(tmp, "wb") as f:
+            f.write(data)
+    else:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(obj, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, path)
+
+
+# path -> (mtime, ticker -> company name); reused across snapshot builds in one process
+_COMPANY_MAP_CACHE: Dict[str, Tuple[float, Dict[str, str]]] = {}
 
 
 def _load_company_map(ticker_info_csv: Optional[str]) -> Dict[str, str]:
@@ -28,6 +57,11 @@ def _load_company_map(ticker_info_csv: Optional[str]) -> Dict[str, str]:
     if not ticker_info_csv or not os.path.exists(ticker_info_csv):
         return {}
 
+    mtime = os.path.getmtime(ticker_info_csv)
+    cached = _COMPANY_MAP_CACHE.get(ticker_info_csv)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
     try:
         info = pd.read_csv(ticker_info_csv)
     except Exception:
@@ -48,15 +82,40 @@ def _load_company_map(ticker_info_csv: Optional[str]) -> Dict[str, str]:
     if not name_col:
         return {}
 
-    m: Dict[str, str] = {}
-    for _, r in info.iterrows():
-        t = str(r.get(ticker_col, "")).strip().upper()
-        nm = str(r.get(name_col, "")).strip()
-        if t:
-            m[t] = nm
+    tickers = info[ticker_col].astype(str).str.strip().str.upper()
+    names = info[name_col].astype(str).str.strip()
+    mask = tickers.ne("")
+    m = dict(zip(tickers[mask].tolist(), names[mask].tolist()))
+    _COMPANY_MAP_CACHE[ticker_info_csv] = (mtime, m)
     return m
 
 
+def _read_prices_csv(path: str) -> pd.DataFrame:
+    """
+    Read the hourly tape with ticker as a categorical (sorted categories).
+    Uses pyarrow's CSV reader when available, pandas otherwise.
+    """
+    if pacsv is None:
+        return pd.read_csv(path, dtype={"ticker": "category"})
+
+    table = pacsv.read_csv(
+        path,
+        convert_options=pacsv.ConvertOptions(
+            column_types={
+                "ticker": pa.dictionary(pa.int32(), pa.string()),
+                # keep as text: the snapshot echoes timestamps verbatim
+                "timestamp": pa.string(),
+                "date": pa.string(),
+            },
+        ),
+    )
+    df = table.to_pandas()
+    if "ticker" in df.columns:
+        # Arrow dictionaries are in first-seen order; snapshot rows are alphabetical
+        df["ticker"] = df["ticker"].cat.reorder_categories(sorted(df["ticker"].cat.categories))
+    return df
+
+
 def build_latest_prices_snapshot(
     prices_hourly_csv: str,
     out_path: str,
@@ -70,7 +129,8 @@ def build_latest_prices_snapshot(
       - chg/chg_pct vs previous bar
       - series (last `lookback` closes) + series_ts for charts
     """
-    df = pd.read_csv(prices_hourly_csv)
+    # categorical ticker: sorting/grouping works on small integer codes
+    df = _read_prices_csv(prices_hourly_csv)
     if df.empty:
         write_json(out_path, {"timestamp": None, "rows": []})
         return
@@ -82,55 +142,98 @@ def build_latest_prices_snapshot(
         write_json(out_path, {"timestamp": None, "rows": [], "error": f"Missing columns: {sorted(missing)}"})
         return
 
-    df_sorted = df.sort_values(["ticker", "timestamp"]).copy()
-    df_sorted["prev_close"] = df_sorted.groupby("ticker")["close"].shift(1)
-    df_sorted["chg"] = df_sorted["close"] - df_sorted["prev_close"]
-    df_sorted["chg_pct"] = df_sorted["chg"] / df_sorted["prev_close"]
+    if df["timestamp"].is_monotonic_increasing:
+        # append-only tape is already in time order: a stable regroup by ticker suffices
+        df_sorted = df.sort_values("ticker", kind="mergesort")
+    else:
+        df_sorted = df.sort_values(["ticker", "timestamp"])
+    close = df_sorted["close"].to_numpy(dtype=float)
+    prev = df_sorted.groupby("ticker", sort=False, observed=True)["close"].shift(1).to_numpy(dtype=float)
+    # first bar of each ticker has no previous close -> zero change
+    has_prev = np.isfinite(prev)
+    chg = np.where(has_prev, close - np.where(has_prev, prev, 0.0), 0.0)
+    ok_pct = has_prev & (prev != 0)
+    df_sorted["chg"] = chg
+    df_sorted["chg_pct"] = np.where(ok_pct, chg / np.where(ok_pct, prev, 1.0), 0.0)
 
     latest_ts = df_sorted["timestamp"].iloc[-1]
     last = df_sorted[df_sorted["timestamp"] == latest_ts].copy()
 
     company_map = _load_company_map(ticker_info_csv)
 
-    rows: List[Dict[str, Any]] = []
+    # Chart history for every ticker in one pass. groupby.tail keeps df_sorted's
+    # order, so each ticker's bars are one contiguous run: split at code changes.
+    hist = df_sorted.groupby("ticker", sort=False, observed=True).tail(int(lookback))
+    codes = hist["ticker"].cat.codes.to_numpy()
+    bounds = np.flatnonzero(codes[1:] != codes[:-1]) + 1
+    run_tickers = hist["ticker"].to_numpy()[np.r_[0, bounds]] if len(hist) else []
+    close_runs = np.split(np.round(hist["close"].to_numpy(dtype=float), 4), bounds)
+    ts_runs = np.split(hist["timestamp"].astype(str).to_numpy(), bounds)
+    series_map = {t: c.tolist() for t, c in zip(run_tickers, close_runs)}
+    series_ts_map = {t: x.tolist() for t, x in zip(run_tickers, ts_runs)}
+
     # Keep stable ordering
     last = last.sort_values("ticker")
+    n = len(last)
+    tickers = last["ticker"].astype(str).tolist()
+    sectors = last["sector"].astype(str).tolist() if "sector" in last.columns else [""] * n
+    volumes = last["volume"].fillna(0).astype(np.int64).tolist() if "volume" in last.columns else [0] * n
+    closes = np.round(last["close"].to_numpy(dtype=float), 4).tolist()
+    chgs = np.round(last["chg"].to_numpy(dtype=float), 4).tolist()
+    chg_pcts = last["chg_pct"].to_numpy(dtype=float).tolist()
 
-    for _, r in last.iterrows():
-        t = str(r["ticker"]).upper()
-
-        hist = df_sorted[df_sorted["ticker"] == t].tail(int(lookback))
-        series = [round(float(x), 4) for x in hist["close"].tolist()]
-        series_ts = [str(x) for x in hist["timestamp"].tolist()]
-
+    rows: List[Dict[str, Any]] = []
+    for t, sector, close_px, volume, chg, chg_pct in zip(tickers, sectors, closes, volumes, chgs, chg_pcts):
         rows.append({
-            "ticker": t,
-            "company_name": company_map.get(t, ""),
-            "sector": str(r.get("sector", "")),
-            "close": round(float(r["close"]), 4),
-            "volume": int(r.get("volume", 0)) if pd.notna(r.get("volume", 0)) else 0,
-            "chg": round(float(r["chg"]), 4) if pd.notna(r.get("chg")) else 0.0,
-            "chg_pct": float(r["chg_pct"]) if pd.notna(r.get("chg_pct")) else 0.0,
-            "series": series,
-            "series_ts": series_ts,
+            "ticker": t.upper(),
+            "company_name": company_map.get(t.upper(), ""),
+            "sector": sector,
+            "close": close_px,
+            "volume": volume,
+            "chg": chg,
+            "chg_pct": chg_pct,
+            "series": series_map.get(t, []),
+            "series_ts": series_ts_map.get(t, []),
         })
 
     write_json(out_path, {"timestamp": str(latest_ts), "rows": rows[:max_rows]})
 
 
+def _tail_lines(path: str, limit: int, chunk_size: int = 64 * 1024) -> List[bytes]:
+    """
+    Return the last `limit` non-empty lines of a file, reading backwards in
+    fixed-size chunks so only the tail of the file is touched.
+    """
+    if limit <= 0:
+        return []
+
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        buf = b""
+        while pos > 0:
+            step = min(chunk_size, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+            # one extra newline guarantees the oldest kept line is complete
+            if buf.count(b"\n") > limit:
+                break
+
+    lines = buf.split(b"\n")
+    if pos > 0:
+        # first piece may be a partial line cut by the chunk boundary
+        lines = lines[1:]
+    return [ln for ln in lines if ln.strip()][-limit:]
+
+
 def build_latest_news_snapshot(news_jsonl: str, out_path: str, limit: int = 50) -> None:
     if not os.path.exists(news_jsonl):
         write_json(out_path, {"timestamp": None, "items": []})
         return
 
-    items = []
-    with open(news_jsonl, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            items.append(json.loads(line))
-
-    items = items[-limit:]
+    # both decoders take the raw UTF-8 bytes
+    loads = orjson.loads if orjson is not None else json.loads
+    items = [loads(line) for line in _tail_lines(news_jsonl, limit)]
     latest_ts = items[-1]["timestamp"] if items else None
     write_json(out_path, {"timestamp": latest_ts, "items": items})
@@ -4,22 +4,42 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, Tuple
 
+import numpy as np
+
 @dataclass(frozen=True)
 class ExecConfig:
     fee_per_trade: float = 1.00            # flat $ fee
     slippage_bps: float = 5.0              # 5 bps = 0.05%
     execution_price: str = "close"         # "open" or "close"
 
+# BUY pays up (+1), SELL receives less (-1)
+_SIDE_SIGN = {"BUY": 1.0, "SELL": -1.0}
+
+def side_signs(sides) -> np.ndarray:
+    """
+    Vector of +1.0 (BUY) / -1.0 (SELL) for an array-like of side strings
+    (case-insensitive, str or bytes).
+    """
+    s = np.char.upper(np.char.strip(np.asarray(sides).astype(str)))
+    buy = s == "BUY"
+    if not (buy | (s == "SELL")).all():
+        raise ValueError("side must be BUY or SELL")
+    return np.where(buy, 1.0, -1.0)
+
 def apply_slippage(price: float, side: str, slippage_bps: float) -> float:
     """
     Buy pays up, sell receives less.
     """
-    bps = slippage_bps / 10_000.0
-    if side.lower() == "buy":
-        return price * (1.0 + bps)
-    if side.lower() == "sell":
-        return price * (1.0 - bps)
-    raise ValueError("side must be BUY or SELL")
+    sign = _SIDE_SIGN.get(side) or _SIDE_SIGN.get(side.upper())
+    if sign is None:
+        raise ValueError("side must be BUY or SELL")
+    return price * (1.0 + sign * (slippage_bps / 10_000.0))
+
+def apply_slippage_vec(prices: np.ndarray, sides, slippage_bps: float) -> np.ndarray:
+    """
+    Array version of apply_slippage for a batch of fills.
+    """
+    return np.asarray(prices, dtype=float) * (1.0 + side_signs(sides) * (slippage_bps / 10_000.0))
 
 def get_execution_price(px_row: Dict, which: str) -> float:
     if which == "open":
@@ -19,7 +19,13 @@ class ParsedOrder:
     notes: str = ""
 
 
-_SECTION_RE = re.compile(r"^###\s+(?P<key>.+?)\s*$", re.MULTILINE)
+# One pass per body: each match is a heading line plus everything up to the next heading.
+_SECTION_RE = re.compile(
+    r"^###[ \t]+(?P<key>[^\n]+?)[ \t\r]*(?:\n|\Z)(?P<val>.*?)(?=^###\s|\Z)",
+    re.MULTILINE | re.DOTALL,
+)
+
+_ALLOWED_TICKERS = frozenset(TICKERS_87)
 
 def _extract_sections(body: str) -> Dict[str, str]:
     """
@@ -28,35 +34,25 @@ def _extract_sections(body: str) -> Dict[str, str]:
     ### Team name
     team1
 
-    We'll parse into a dict: {"Team name": "team1", ...}
+    We'll parse into a dict keyed by lower-cased heading: {"team name": "team1", ...}
     """
-    matches = list(_SECTION_RE.finditer(body))
-    sections: Dict[str, str] = {}
-
-    for i, m in enumerate(matches):
-        key = m.group("key").strip()
-        start = m.end()
-        end = matches[i + 1].start() if i + 1 < len(matches) else len(body)
-        value = body[start:end].strip()
-
-        # normalize common blank markers
-        value = value.replace("\r\n", "\n").strip()
-        sections[key] = value
-
-    return sections
+    return {
+        m.group("key").strip().lower(): m.group("val").replace("\r\n", "\n").strip()
+        for m in _SECTION_RE.finditer(body)
+    }
 
 
 def parse_order_from_issue_body(body: str) -> ParsedOrder:
     sections = _extract_sections(body)
 
-    # keys must match the labels in the form above
-    team = (sections.get("Team name") or "").strip()
-    side = (sections.get("Side") or "").strip().upper()
-    ticker = (sections.get("Ticker") or "").strip().upper()
-    qty_raw = (sections.get("Quantity (shares)") or "").strip()
-    order_type = (sections.get("Order type") or "").strip().upper()
-    limit_raw = (sections.get("Limit price (only if LIMIT)") or "").strip()
-    notes = (sections.get("Notes (optional)") or "").strip()
+    # keys must match the (lower-cased) labels in the issue form
+    team = sections.get("team name", "")
+    side = sections.get("side", "").upper()
+    ticker = sections.get("ticker", "").upper()
+    qty_raw = sections.get("quantity (shares)", "")
+    order_type = sections.get("order type", "").upper()
+    limit_raw = sections.get("limit price (only if limit)", "")
+    notes = sections.get("notes (optional)", "")
 
     if not team:
         raise ValueError("Missing team name.")
@@ -64,8 +60,7 @@ def parse_order_from_issue_body(body: str) -> ParsedOrder:
     if side not in {"BUY", "SELL"}:
         raise ValueError(f"Invalid side: {side}")
 
-    allowed = set(TICKERS_87)
-    if ticker not in allowed:
+    if ticker not in _ALLOWED_TICKERS:
         raise ValueError(f"Ticker not in universe: {ticker}")
 
     try:
@@ -3,18 +3,31 @@ from __future__ import annotations
 
 from typing import Optional, Tuple
 
+import numpy as np
+
+from .execution import side_signs
+
+_IS_BUY = {"BUY": True, "SELL": False}
+
 def limit_order_fills(side: str, limit_price: float, bar_high: float, bar_low: float) -> bool:
     """
     Simple touch logic:
       BUY  fills if low <= limit
       SELL fills if high >= limit
     """
-    side = side.upper().strip()
-    if side == "BUY":
-        return bar_low <= limit_price
-    if side == "SELL":
-        return bar_high >= limit_price
-    raise ValueError("side must be BUY or SELL")
+    is_buy = _IS_BUY.get(side)
+    if is_buy is None:
+        is_buy = _IS_BUY.get(side.upper().strip())
+        if is_buy is None:
+            raise ValueError("side must be BUY or SELL")
+    return bar_low <= limit_price if is_buy else bar_high >= limit_price
+
+def limit_order_fills_vec(sides, limit_prices: np.ndarray, bar_highs: np.ndarray, bar_lows: np.ndarray) -> np.ndarray:
+    """
+    Array version of limit_order_fills: boolean fill mask for a batch of orders.
+    """
+    is_buy = side_signs(sides) > 0
+    return np.where(is_buy, np.asarray(bar_lows) <= limit_prices, np.asarray(bar_highs) >= limit_prices)
 
 def limit_fill_price(side: str, limit_price: float) -> float:
     """
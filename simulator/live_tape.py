@@ -1,6 +1,8 @@
 # simulator/live_tape.py
 from __future__ import annotations
 
+import csv
+import glob
 import json
 import os
 from dataclasses import dataclass
@@ -9,41 +11,41 @@ from typing import Dict, List, Tuple, Optional
 import numpy as np
 import pandas as pd
 
+try:  # optional: C JSON codec
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
 from .universe import TICKERS_87
 from .security_master import SecurityMaster
 from news_generator.synthetic_news import NEWS_EVENT_TYPES, random_headline
-
-SECTORS = ["Tech", "Financials", "Consumer", "Industrials", "Energy", "Healthcare", "Comm", "Speculative"]
-
-REGIMES = {
-    "bull":     {"mu": 0.0006, "sigma": 0.010},
-    "sideways": {"mu": 0.0001, "sigma": 0.008},
-    "bear":     {"mu": -0.0006, "sigma": 0.012},
-    "crisis":   {"mu": -0.0012, "sigma": 0.025},
-}
-
-REGIME_TRANSITIONS = {
-    "bull":     {"bull": 0.92, "sideways": 0.06, "bear": 0.015, "crisis": 0.005},
-    "sideways": {"bull": 0.10, "sideways": 0.82, "bear": 0.06, "crisis": 0.02},
-    "bear":     {"bull": 0.06, "sideways": 0.18, "bear": 0.70, "crisis": 0.06},
-    "crisis":   {"bull": 0.05, "sideways": 0.15, "bear": 0.35, "crisis": 0.45},
-}
+from ._tape_common import (
+    EVENT_PROBS, EVENT_TYPES, MACRO_CDF, MACRO_HEADLINES, MACRO_KEYS, REGIME_IDX, REGIME_TRANSITIONS, REGIMES,
+    SECTORS, next_regime, sample_cdf,
+)
 
 # 7 class-friendly hourly ticks per business day
 BAR_HOURS = [10, 11, 12, 13, 14, 15, 16]
 BARS_PER_DAY = len(BAR_HOURS)
 
-def _ensure_parent(path: str) -> None:
-    os.makedirs(os.path.dirname(path), exist_ok=True)
+_INV_SQRT_BPD = 1.0 / np.sqrt(BARS_PER_DAY)
+_SECTOR_NAMES = np.array(SECTORS)
+_SPEC_IDX = SECTORS.index("Speculative")
 
-def _weighted_choice(rng: np.random.Generator, items: List[str], weights: List[float]) -> str:
-    w = np.array(weights, dtype=float)
-    w = w / w.sum()
-    return items[int(rng.choice(len(items), p=w))]
+# per-regime hourly (mu, sigma)
+_REGIME_HOURLY = {r: (p["mu"] / BARS_PER_DAY, p["sigma"] * _INV_SQRT_BPD) for r, p in REGIMES.items()}
 
-def _next_regime(rng: np.random.Generator, current: str) -> str:
-    probs = REGIME_TRANSITIONS[current]
-    return _weighted_choice(rng, list(probs.keys()), list(probs.values()))
+# News event table as parallel arrays
+_EVENT_TYPES = np.array(EVENT_TYPES)
+_JUMP_LO = np.array([NEWS_EVENT_TYPES[e]["jump_range"][0] for e in _EVENT_TYPES])  # type: ignore
+_JUMP_HI = np.array([NEWS_EVENT_TYPES[e]["jump_range"][1] for e in _EVENT_TYPES])  # type: ignore
+_VOL_MULT = np.array([NEWS_EVENT_TYPES[e]["vol_mult"] for e in _EVENT_TYPES], dtype=float)
+_SENTIMENT = np.array([NEWS_EVENT_TYPES[e]["sentiment"] for e in _EVENT_TYPES])
+
+_EVENT_CDF = np.cumsum(EVENT_PROBS, axis=-1)
+
+def _ensure_parent(path: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
 
 def _advance_to_next_business_day(date_str: str) -> str:
     d = pd.Timestamp(date_str)
@@ -115,39 +117,136 @@ class LiveTapeConfig:
     macro_news_prob: float = 0.18
     intrabar_range_mult: float = 1.10
 
+# Per-ticker fields held as arrays indexed by ticker id (position in "universe").
+_ARRAY_FIELDS = {
+    "market_beta": np.float64,
+    "sector_beta": np.float64,
+    "idio_sigma": np.float64,
+    "base_vol": np.int64,
+    "last_close": np.float64,
+    "sec_idx": np.int8,
+}
+
+# Rebuilt on load, never written to disk. "rng" is the live Generator behind
+# "rng_state"; it is kept across bars and only synced back by flush_rng().
+_DERIVED_KEYS = {"ticker_ids", "rng"}
+
+def _sector_index(sector_name: str) -> int:
+    if sector_name not in SECTORS:
+        sector_name = "Speculative"
+    return SECTORS.index(sector_name)
+
+def _materialize_arrays(state: Dict) -> Dict:
+    """
+    Convert the per-ticker fields of a freshly loaded state into NumPy arrays
+    indexed by ticker id, in place. Accepts arrays read from the .npz sidecar
+    as well as older all-JSON states (lists, or dicts keyed by ticker).
+    """
+    universe: List[str] = state["universe"]
+    state["ticker_ids"] = {t: i for i, t in enumerate(universe)}
+
+    if "sec_idx" not in state:
+        names = state.pop("sector_name_by_ticker", {}) or {}
+        state["sec_idx"] = [_sector_index(names.get(t, "Speculative")) for t in universe]
+    if "company_names" not in state:
+        names = state.pop("company_name_by_ticker", {}) or {}
+        state["company_names"] = [names.get(t, "") for t in universe]
+
+    for key, dtype in _ARRAY_FIELDS.items():
+        values = state[key]
+        if isinstance(values, dict):
+            values = [values[t] for t in universe]
+        state[key] = np.asarray(values, dtype=dtype)
+    return state
+
+def _arrays_path(cfg: LiveTapeConfig, generation: Optional[int] = None) -> str:
+    """
+    Binary sidecar next to the JSON state, e.g. market_state_arrays.3.npz for generation 3
+    (market_state_arrays.npz for states saved before generations were recorded).
+    """
+    stem = os.path.splitext(cfg.state_path)[0] + "_arrays"
+    return stem + ".npz" if generation is None else f"{stem}.{generation}.npz"
+
+def _get_rng(state: Dict) -> np.random.Generator:
+    rng = state.get("rng")
+    if rng is None:
+        rng = np.random.default_rng()
+        rng.bit_generator.state = state["rng_state"]
+        state["rng"] = rng
+    return rng
+
+def flush_rng(state: Dict) -> None:
+    """Copy the live generator position back into state["rng_state"] (before any checkpoint)."""
+    rng = state.get("rng")
+    if rng is not None:
+        state["rng_state"] = rng.bit_generator.state
+
 def save_state(cfg: LiveTapeConfig, state: Dict) -> None:
+    """
+    Per-ticker arrays go to an .npz sidecar, everything else (cursor, regime,
+    rng_state, names) to the JSON state. Each save writes a new sidecar generation
+    named by the JSON, and the JSON is replaced last: a crash at any point leaves
+    the previous JSON pointing at its own, still present, sidecar.
+    """
     _ensure_parent(cfg.state_path)
-    with open(cfg.state_path, "w", encoding="utf-8") as f:
-        json.dump(state, f, indent=2)
+    flush_rng(state)
+
+    generation = int(state.get("arrays_generation") or 0) + 1
+    arrays_path = _arrays_path(cfg, generation)
+    tmp = arrays_path + ".tmp"
+    with open(tmp, "wb") as f:
+        np.savez(f, **{k: np.asarray(state[k], dtype=dtype) for k, dtype in _ARRAY_FIELDS.items()})
+    os.replace(tmp, arrays_path)
+
+    small = {k: v for k, v in state.items() if k not in _ARRAY_FIELDS and k not in _DERIVED_KEYS}
+    small["arrays_generation"] = generation
+    tmp = cfg.state_path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(small, f, indent=2)
+    os.replace(tmp, cfg.state_path)
+    state["arrays_generation"] = generation
+
+    # Older sidecars are unreferenced only once the new JSON is in place
+    stale = glob.glob(glob.escape(os.path.splitext(cfg.state_path)[0] + "_arrays") + ".*npz")
+    for path in stale:
+        if path != arrays_path:
+            os.remove(path)
 
 def load_or_create_state(cfg: LiveTapeConfig, start_date: Optional[str] = None, start_regime: str = "sideways") -> Dict:
     _ensure_parent(cfg.state_path)
 
     if os.path.exists(cfg.state_path):
         with open(cfg.state_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+            state = json.load(f)
+        generation = state.get("arrays_generation")
+        arrays_path = _arrays_path(cfg, generation)
+        # a recorded generation must have its sidecar; older states may be all-JSON
+        if generation is not None or os.path.exists(arrays_path):
+            # each member is decoded into its own (writable) array
+            with np.load(arrays_path) as npz:
+                for key in _ARRAY_FIELDS:
+                    state[key] = npz[key]
+        return _materialize_arrays(state)
 
     rng = np.random.default_rng(cfg.seed)
     universe = cfg.universe or list(TICKERS_87)
 
     sm = _load_security_master(cfg.security_master_csv)
-    sector_name_by_ticker = {}
-    company_name_by_ticker = {}
-    for t in universe:
-        if sm:
-            sector_name_by_ticker[t] = _normalize_sector_name(sm.sector_of(t, default="Speculative"))
-            company_name_by_ticker[t] = sm.company_name_of(t, default="")
-        else:
-            sector_name_by_ticker[t] = "Speculative"
-            company_name_by_ticker[t] = ""
+    if sm:
+        sec_idx = [_sector_index(_normalize_sector_name(sm.sector_of(t, default="Speculative"))) for t in universe]
+        company_names = [sm.company_name_of(t, default="") for t in universe]
+    else:
+        sec_idx = [SECTORS.index("Speculative")] * len(universe)
+        company_names = [""] * len(universe)
 
-    market_beta = {t: float(np.clip(rng.normal(cfg.market_beta_mean, cfg.market_beta_sd), 0.2, 2.2)) for t in universe}
-    sector_beta = {t: float(np.clip(rng.normal(cfg.sector_beta_mean, cfg.sector_beta_sd), 0.0, 1.5)) for t in universe}
-    idio_sigma  = {t: float(rng.uniform(cfg.idio_sigma_min, cfg.idio_sigma_max)) for t in universe}
-    base_vol    = {t: int(rng.integers(cfg.base_volume_min, cfg.base_volume_max + 1)) for t in universe}
+    N = len(universe)
+    market_beta = np.clip(rng.normal(cfg.market_beta_mean, cfg.market_beta_sd, N), 0.2, 2.2)
+    sector_beta = np.clip(rng.normal(cfg.sector_beta_mean, cfg.sector_beta_sd, N), 0.0, 1.5)
+    idio_sigma  = rng.uniform(cfg.idio_sigma_min, cfg.idio_sigma_max, N)
+    base_vol    = rng.integers(cfg.base_volume_min, cfg.base_volume_max + 1, N)
 
-    start_prices = np.exp(rng.normal(cfg.start_price_log_mu, cfg.start_price_log_sigma, size=len(universe)))
-    last_close = {t: float(max(2.0, p)) for t, p in zip(universe, start_prices)}
+    start_prices = np.exp(rng.normal(cfg.start_price_log_mu, cfg.start_price_log_sigma, size=N))
+    last_close = np.maximum(2.0, start_prices)
 
     if start_date is None:
         start_date = str(pd.bdate_range(pd.Timestamp.today().normalize(), periods=1)[0].date())
@@ -155,8 +254,9 @@ def load_or_create_state(cfg: LiveTapeConfig, start_date: Optional[str] = None,
     state = {
         "universe": universe,
         "rng_state": rng.bit_generator.state,
-        "sector_name_by_ticker": sector_name_by_ticker,
-        "company_name_by_ticker": company_name_by_ticker,
+        "rng": rng,
+        "sec_idx": sec_idx,
+        "company_names": company_names,
         "market_beta": market_beta,
         "sector_beta": sector_beta,
         "idio_sigma": idio_sigma,
@@ -167,6 +267,7 @@ def load_or_create_state(cfg: LiveTapeConfig, start_date: Optional[str] = None,
         "current_bar_index": 0,
         "current_macro_headline": None,
     }
+    _materialize_arrays(state)
     save_state(cfg, state)
     return state
 
@@ -174,143 +275,128 @@ def _maybe_new_day_context(cfg: LiveTapeConfig, rng: np.random.Generator, state:
     if int(state["current_bar_index"]) != 0:
         return
 
-    state["current_regime"] = _next_regime(rng, state["current_regime"])
+    state["current_regime"] = next_regime(rng, state["current_regime"])
 
     if rng.random() < cfg.macro_news_prob:
-        state["current_macro_headline"] = _weighted_choice(
-            rng,
-            ["Inflation cools", "Inflation spikes", "Jobs surprise", "Rates repriced", "Geopolitical tension", "Soft landing talk"],
-            [0.16, 0.14, 0.18, 0.20, 0.16, 0.16],
-        )
+        state["current_macro_headline"] = sample_cdf(rng, MACRO_KEYS, MACRO_CDF)
     else:
         state["current_macro_headline"] = None
 
+def _step_kernel(last_close, betas_m, betas_s, idio_sigma, base_vol, sec_idx, sector_r_vec, r_mkt,
+                 z_idio, z_hi, z_lo, u_vol, shock_ret, vol_mult, intrabar_mult):
+    """
+    Per-bar OHLCV math for the whole universe, given the bar's random draws.
+    Returns (open, high, low, close, ret, volume, new_last_close).
+    """
+    r_idio = z_idio * (idio_sigma * vol_mult * _INV_SQRT_BPD)
+    r_total = (betas_m * r_mkt) + (betas_s * sector_r_vec[sec_idx]) + r_idio + shock_ret
+    np.clip(r_total, -0.20, 0.20, out=r_total)
+
+    open_px = last_close
+    close_px = open_px * (1.0 + r_total)
+
+    intr_sig = (np.abs(r_total) + idio_sigma * _INV_SQRT_BPD) * intrabar_mult
+    high_px = np.maximum(open_px, close_px) * (1.0 + np.abs(z_hi * intr_sig))
+    low_px = np.minimum(open_px, close_px) * (1.0 - np.abs(z_lo * intr_sig))
+
+    vol_bump = 1.0 + 8.0 * np.minimum(0.06, np.abs(r_total))
+    vol_bump = np.where(shock_ret != 0.0, vol_bump * 1.3, vol_bump)
+    volume = np.maximum(1000, base_vol * vol_bump * u_vol / BARS_PER_DAY).astype(np.int64)
+
+    return open_px, high_px, low_px, close_px, r_total, volume, np.maximum(0.5, close_px)
+
 def step_one_bar(cfg: LiveTapeConfig, state: Dict) -> Tuple[str, pd.DataFrame, List[Dict]]:
-    rng = np.random.default_rng()
-    rng.bit_generator.state = state["rng_state"]
+    rng = _get_rng(state)
 
     universe: List[str] = state["universe"]
     date_str: str = state["current_date"]
     bar_i: int = int(state["current_bar_index"])
 
+    sec_idx: np.ndarray = state["sec_idx"]
+    idio_sigma: np.ndarray = state["idio_sigma"]
+    N = len(universe)
+
     _maybe_new_day_context(cfg, rng, state)
     regime: str = state["current_regime"]
     macro_headline = state["current_macro_headline"]
 
-    # daily -> hourly scaling
-    mu_d = REGIMES[regime]["mu"]
-    sig_d = REGIMES[regime]["sigma"]
-    mu_h = mu_d / BARS_PER_DAY
-    sig_h = sig_d / np.sqrt(BARS_PER_DAY)
+    mu_h, sig_h = _REGIME_HOURLY[regime]
+    reg_i = REGIME_IDX[regime]
 
     r_mkt = float(rng.normal(mu_h, sig_h))
-    sector_r = {i: float(rng.normal(0.0, 0.65 * sig_h)) for i in range(len(SECTORS))}
+    sector_r_vec = rng.normal(0.0, 0.65 * sig_h, size=len(SECTORS))
+    r_sector = sector_r_vec[sec_idx]
 
     p_news_base = 1.0 - (1.0 - cfg.news_prob_per_day) ** (1.0 / BARS_PER_DAY)
+    p_news = (
+        p_news_base
+        * (cfg.news_prob_crisis_mult if regime == "crisis" else 1.0)
+        * np.where(sec_idx == _SPEC_IDX, cfg.news_prob_spec_mult, 1.0)
+    )
+
+    # Bulk draws: one generator call per distribution for the whole universe
+    u_news = rng.random(N)
+    news_idx = np.flatnonzero(u_news < p_news)
+    u_event = rng.random(news_idx.size)
+    z = rng.standard_normal((3, N))  # idio, high spread, low spread
+    u_vol = rng.uniform(0.85, 1.15, size=N)
+
+    # Event types by inverse CDF on each news ticker's (sector, regime) row
+    cdf = _EVENT_CDF[sec_idx[news_idx], reg_i]
+    etypes = np.minimum((u_event[:, None] >= cdf).sum(axis=1), len(_EVENT_TYPES) - 1)
+    shocks = rng.uniform(_JUMP_LO[etypes], _JUMP_HI[etypes]) * 0.5  # smaller per hour
+
+    shock_ret = np.zeros(N)
+    shock_ret[news_idx] = shocks
+    vol_mult = np.ones(N)
+    vol_mult[news_idx] = _VOL_MULT[etypes]
 
     ts = _bar_timestamp(date_str, bar_i)
-    rows: List[Dict] = []
+    company_names: List[str] = state["company_names"]
     news_rows: List[Dict] = []
-
-    for t in universe:
-        sector_name = state["sector_name_by_ticker"].get(t, "Speculative")
-        if sector_name not in SECTORS:
-            sector_name = "Speculative"
-        sec_idx = SECTORS.index(sector_name)
-        company = (state.get("company_name_by_ticker", {}) or {}).get(t, "")
-
-        id_sig = float(state["idio_sigma"][t])
-        beta_m = float(state["market_beta"][t])
-        beta_s = float(state["sector_beta"][t])
-
-        p_news = p_news_base
-        if regime == "crisis":
-            p_news *= cfg.news_prob_crisis_mult
-        if sector_name == "Speculative":
-            p_news *= cfg.news_prob_spec_mult
-
-        shock_ret = 0.0
-        vol_mult = 1.0
-
-        if rng.random() < p_news:
-            event_types = list(NEWS_EVENT_TYPES.keys())
-            weights = np.ones(len(event_types), dtype=float)
-
-            if sector_name == "Speculative":
-                for i, et in enumerate(event_types):
-                    if "meme" in et:
-                        weights[i] *= 2.2
-            if sector_name == "Energy":
-                for i, et in enumerate(event_types):
-                    if "macro_" in et:
-                        weights[i] *= 1.6
-            if regime == "crisis":
-                for i, et in enumerate(event_types):
-                    if et in {"macro_headwind", "regulatory_risk", "lawsuit", "earnings_miss"}:
-                        weights[i] *= 1.5
-
-            etype = _weighted_choice(rng, event_types, weights.tolist())
-            spec = NEWS_EVENT_TYPES[etype]
-            lo, hi = spec["jump_range"]  # type: ignore
-            shock_ret = float(rng.uniform(lo, hi)) / 2.0  # smaller per hour
-            vol_mult = float(spec["vol_mult"])  # type: ignore
-
-            news_rows.append({
-                "timestamp": ts,
-                "date": date_str,
-                "ticker": t,
-                "company_name": company,
-                "event_type": etype,
-                "sentiment": spec["sentiment"],
-                "headline": random_headline(rng, etype, t),
-                "shock_return": shock_ret,
-                "macro_context": macro_headline,
-                "regime": regime,
-            })
-
-        r_sector = sector_r[sec_idx]
-        r_idio = float(rng.normal(0.0, (id_sig * vol_mult) / np.sqrt(BARS_PER_DAY)))
-        r_total = (beta_m * r_mkt) + (beta_s * r_sector) + r_idio + shock_ret
-        r_total = float(np.clip(r_total, -0.20, 0.20))
-
-        prev_close = float(state["last_close"][t])
-        open_px = prev_close
-        close_px = open_px * (1.0 + r_total)
-
-        intr_sig = (abs(r_total) + id_sig / np.sqrt(BARS_PER_DAY)) * cfg.intrabar_range_mult
-        hi_spread = abs(float(rng.normal(0.0, intr_sig)))
-        lo_spread = abs(float(rng.normal(0.0, intr_sig)))
-        high_px = max(open_px, close_px) * (1.0 + hi_spread)
-        low_px = min(open_px, close_px) * (1.0 - lo_spread)
-
-        base_v = int(state["base_vol"][t])
-        vol_bump = 1.0 + 8.0 * min(0.06, abs(r_total))
-        if shock_ret != 0.0:
-            vol_bump *= 1.3
-        volume = int(max(1000, base_v * vol_bump * float(rng.uniform(0.85, 1.15)) / BARS_PER_DAY))
-
-        state["last_close"][t] = float(max(0.5, close_px))
-
-        rows.append({
+    for i, e, shock in zip(news_idx.tolist(), etypes.tolist(), shocks.tolist()):
+        t = universe[i]
+        etype = str(_EVENT_TYPES[e])
+        news_rows.append({
             "timestamp": ts,
             "date": date_str,
-            "bar_index": bar_i,
             "ticker": t,
-            "sector": sector_name,
+            "company_name": company_names[i],
+            "event_type": etype,
+            "sentiment": str(_SENTIMENT[e]),
+            "headline": random_headline(rng, etype, t),
+            "shock_return": shock,
+            "macro_context": macro_headline,
             "regime": regime,
-            "macro_headline": macro_headline,
-            "open": round(float(open_px), 4),
-            "high": round(float(high_px), 4),
-            "low": round(float(low_px), 4),
-            "close": round(float(close_px), 4),
-            "volume": volume,
-            "ret": round(float(r_total), 6),
-            "market_ret": round(float(r_mkt), 6),
-            "sector_ret": round(float(r_sector), 6),
-            "shock_ret": round(float(shock_ret), 6),
-            "has_news": int(shock_ret != 0.0),
         })
 
+    open_px, high_px, low_px, close_px, r_total, volume, new_last_close = _step_kernel(
+        state["last_close"], state["market_beta"], state["sector_beta"], idio_sigma, state["base_vol"],
+        sec_idx, sector_r_vec, r_mkt, z[0], z[1], z[2], u_vol, shock_ret, vol_mult, cfg.intrabar_range_mult,
+    )
+    has_news = shock_ret != 0.0
+    state["last_close"] = new_last_close
+
+    bar_df = pd.DataFrame({
+        "timestamp": ts,
+        "date": date_str,
+        "bar_index": bar_i,
+        "ticker": universe,
+        "sector": _SECTOR_NAMES[sec_idx],
+        "regime": regime,
+        "macro_headline": macro_headline,
+        "open": np.round(open_px, 4),
+        "high": np.round(high_px, 4),
+        "low": np.round(low_px, 4),
+        "close": np.round(close_px, 4),
+        "volume": volume,
+        "ret": np.round(r_total, 6),
+        "market_ret": round(r_mkt, 6),
+        "sector_ret": np.round(r_sector, 6),
+        "shock_ret": np.round(shock_ret, 6),
+        "has_news": has_news.astype(int),
+    })
+
     # advance cursor
     bar_i += 1
     if bar_i >= BARS_PER_DAY:
@@ -318,16 +404,25 @@ def step_one_bar(cfg: LiveTapeConfig, state: Dict) -> Tuple[str, pd.DataFrame, L
         state["current_date"] = _advance_to_next_business_day(date_str)
     state["current_bar_index"] = bar_i
 
-    state["rng_state"] = rng.bit_generator.state
-    return ts, pd.DataFrame(rows), news_rows
+    return ts, bar_df, news_rows
 
 def append_outputs(cfg: LiveTapeConfig, bar_df: pd.DataFrame, news_rows: List[Dict]) -> None:
     _ensure_parent(cfg.prices_out)
     _ensure_parent(cfg.news_out)
 
+    # Plain csv.writer over the bar's columns: same text as DataFrame.to_csv
+    # without pandas' per-call formatting machinery.
     write_header = not os.path.exists(cfg.prices_out)
-    bar_df.to_csv(cfg.prices_out, mode="a", index=False, header=write_header)
-
-    with open(cfg.news_out, "a", encoding="utf-8") as f:
-        for item in news_rows:
-            f.write(json.dumps(item, ensure_ascii=False) + "\n")
+    with open(cfg.prices_out, "a", encoding="utf-8", newline="") as f:
+        w = csv.writer(f, lineterminator="\n")
+        if write_header:
+            w.writerow(bar_df.columns)
+        w.writerows(bar_df.itertuples(index=False, name=None))
+
+    if news_rows:
+        if orjson is not None:
+            payload = b"".join(orjson.dumps(item) + b"\n" for item in news_rows)
+        else:
+            payload = "".join(json.dumps(item, ensure_ascii=False) + "\n" for item in news_rows).encode("utf-8")
+        with open(cfg.news_out, "ab") as f:
+            f.write(payload)
@@ -2,13 +2,23 @@
 from __future__ import annotations
 
 import json
-from typing import Dict, List
+from typing import Dict, List, Mapping, Optional, Union
 
 import pandas as pd
 
+try:  # optional: C JSON codec
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
 
-def load_prices(prices_path: str) -> pd.DataFrame:
-    df = pd.read_csv(prices_path)
+from ._fastio import read_csv, read_csv_where
+
+
+def load_prices(prices_path: str, date: Optional[str] = None) -> pd.DataFrame:
+    """
+    Daily bars from prices.csv; with `date`, only that day's rows are kept (filtered while reading).
+    """
+    df = read_csv(prices_path) if date is None else read_csv_where(prices_path, "date", str(date))
     required = {"date", "ticker", "open", "close", "high", "low", "volume"}
     missing = required - set(df.columns)
     if missing:
@@ -16,29 +26,69 @@ def load_prices(prices_path: str) -> pd.DataFrame:
 
     df["ticker"] = df["ticker"].astype(str).str.upper().str.strip()
     df["date"] = df["date"].astype(str)
+
+    # Sorted (unnamed) date index so get_day_prices can binary-search a day
+    df = df.sort_values("date", kind="mergesort")
+    df.index = pd.Index(df["date"].to_numpy())
+    df.attrs["date_indexed"] = True
     return df
 
 
 def load_news_jsonl(news_path: str) -> List[Dict]:
-    rows: List[Dict] = []
     try:
-        with open(news_path, "r", encoding="utf-8") as f:
+        with open(news_path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return []
+    loads = orjson.loads if orjson is not None else json.loads
+    return [loads(line) for line in data.splitlines() if line.strip()]
+
+
+def load_news_for_date(news_path: str, date: str) -> List[Dict]:
+    """
+    One day's news, streamed line by line: only lines mentioning the date are decoded.
+    """
+    date = str(date)
+    needle = date.encode()
+    loads = orjson.loads if orjson is not None else json.loads
+    out: List[Dict] = []
+    try:
+        with open(news_path, "rb") as f:
             for line in f:
-                line = line.strip()
-                if not line:
+                if needle not in line:
                     continue
-                rows.append(json.loads(line))
+                row = loads(line)
+                if str(row.get("date")) == date:
+                    out.append(row)
     except FileNotFoundError:
         return []
-    return rows
+    return out
 
 
 def get_day_prices(prices_df: pd.DataFrame, date: str) -> pd.DataFrame:
-    day = prices_df[prices_df["date"] == date].copy()
+    idx = prices_df.index
+    if idx.name is None and prices_df.attrs.get("date_indexed"):
+        # date-indexed frame from load_prices: O(log n) slice of the day's rows
+        lo, hi = idx.slice_locs(date, date)
+        day = prices_df.iloc[lo:hi].reset_index(drop=True)
+    else:
+        day = prices_df[prices_df["date"] == date].copy()
     if day.empty:
         raise ValueError(f"No prices found for date={date}.")
     return day
 
 
-def get_day_news(news_rows: List[Dict], date: str) -> List[Dict]:
+def group_news_by_date(news_rows: List[Dict]) -> Dict[str, List[Dict]]:
+    """
+    date -> news rows for that date (file order kept), for O(1) get_day_news.
+    """
+    by_date: Dict[str, List[Dict]] = {}
+    for r in news_rows:
+        by_date.setdefault(str(r.get("date")), []).append(r)
+    return by_date
+
+
+def get_day_news(news_rows: Union[List[Dict], Mapping[str, List[Dict]]], date: str) -> List[Dict]:
+    if isinstance(news_rows, Mapping):
+        return news_rows.get(str(date), [])
     return [r for r in news_rows if str(r.get("date")) == str(date)]
@@ -10,24 +10,21 @@ from typing import Dict, List, Tuple
 import numpy as np
 import pandas as pd
 
+try:  # optional: C JSON codec
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+from ._fastio import write_csv
 from .universe import TICKERS_87
 from news_generator.synthetic_news import NEWS_EVENT_TYPES, random_headline
+from ._tape_common import (
+    EVENT_PROBS, EVENT_TYPES, MACRO_CDF, MACRO_HEADLINES, MACRO_KEYS, REGIME_IDX, REGIME_TRANSITIONS, REGIMES,
+    SECTORS, next_regime, sample_cdf,
+)
 
-SECTORS = ["Tech", "Financials", "Consumer", "Industrials", "Energy", "Healthcare", "Comm", "Speculative"]
-
-REGIMES = {
-    "bull":     {"mu": 0.0006, "sigma": 0.010},
-    "sideways": {"mu": 0.0001, "sigma": 0.008},
-    "bear":     {"mu": -0.0006, "sigma": 0.012},
-    "crisis":   {"mu": -0.0012, "sigma": 0.025},
-}
-
-REGIME_TRANSITIONS = {
-    "bull":     {"bull": 0.92, "sideways": 0.06, "bear": 0.015, "crisis": 0.005},
-    "sideways": {"bull": 0.10, "sideways": 0.82, "bear": 0.06, "crisis": 0.02},
-    "bear":     {"bull": 0.06, "sideways": 0.18, "bear": 0.70, "crisis": 0.06},
-    "crisis":   {"bull": 0.05, "sideways": 0.15, "bear": 0.35, "crisis": 0.45},
-}
+_SECTOR_IDX = {s: i for i, s in enumerate(SECTORS)}
+_SPEC_IDX = _SECTOR_IDX["Speculative"]
 
 def _stable_sector(sym: str) -> int:
     return sum(ord(c) for c in sym) % len(SECTORS)
@@ -55,15 +52,6 @@ def _normalize_sector_name(raw: str) -> str:
     }
     return mapping.get(s, "Speculative")  # default bucket
 
-def _weighted_choice(rng: np.random.Generator, items: List[str], weights: List[float]) -> str:
-    w = np.array(weights, dtype=float)
-    w = w / w.sum()
-    return items[int(rng.choice(len(items), p=w))]
-
-def _next_regime(rng: np.random.Generator, current: str) -> str:
-    probs = REGIME_TRANSITIONS[current]
-    return _weighted_choice(rng, list(probs.keys()), list(probs.values()))
-
 @dataclass(frozen=True)
 class TapeConfig:
     start_date: str = "2025-01-01"
@@ -102,11 +90,40 @@ class TapeConfig:
     base_volume_min: int = 2_000_000
     base_volume_max: int = 30_000_000
 
+# Output precision, applied once to the finished frame
+_ROUND_DECIMALS = {
+    "open": 4, "high": 4, "low": 4, "close": 4,
+    "ret": 6, "market_ret": 6, "sector_ret": 6, "shock_ret": 6,
+}
+
 def _company_name(sm: SecurityMaster | None, ticker: str) -> str:
     if sm is None:
         return ""
     return sm.company_name_of(ticker, default="")
 
+def _day_kernel(prev_close, betas_m, betas_s, idio_sigma, base_vol, sec_idx, sector_r, r_mkt,
+                z_idio, z_on, z_hi, z_lo, u_vol, shock_ret, vol_mult, overnight_mult, intraday_mult):
+    """
+    Per-day OHLCV math for the whole universe, given the day's random draws.
+    Returns (open, high, low, close, ret, volume, new_prev_close).
+    """
+    r_idio = z_idio * (idio_sigma * vol_mult)
+    r_total = np.clip(betas_m * r_mkt + betas_s * sector_r[sec_idx] + r_idio + shock_ret, -0.35, 0.35)
+
+    overnight = z_on * (idio_sigma * overnight_mult)
+    open_px = prev_close * (1.0 + overnight)
+    close_px = open_px * (1.0 + r_total)
+
+    intraday_sig = (np.abs(r_total) + idio_sigma) * intraday_mult
+    high_px = np.maximum(open_px, close_px) * (1.0 + np.abs(z_hi * intraday_sig))
+    low_px = np.minimum(open_px, close_px) * (1.0 - np.abs(z_lo * intraday_sig))
+
+    vol_bump = 1.0 + 8.0 * np.minimum(0.08, np.abs(r_total))
+    vol_bump = np.where(shock_ret != 0.0, vol_bump * 1.4, vol_bump)
+    volume = np.maximum(1000, base_vol * vol_bump * u_vol).astype(np.int64)
+
+    return open_px, high_px, low_px, close_px, r_total, volume, np.maximum(0.5, close_px)
+
 def generate_market_tape(cfg: TapeConfig) -> Tuple[pd.DataFrame, List[Dict]]:
     rng = np.random.default_rng(cfg.seed)
     universe = cfg.universe or list(TICKERS_87)
@@ -126,133 +143,128 @@ def generate_market_tape(cfg: TapeConfig) -> Tuple[pd.DataFrame, List[Dict]]:
             # fallback to old hashing if CSV isn't present
             sector_name_by_ticker[t] = SECTORS[_stable_sector(t)]
 
-    # Per-ticker parameters
-    market_beta = {t: float(np.clip(rng.normal(cfg.market_beta_mean, cfg.market_beta_sd), 0.2, 2.2)) for t in universe}
-    sector_beta = {t: float(np.clip(rng.normal(cfg.sector_beta_mean, cfg.sector_beta_sd), 0.0, 1.5)) for t in universe}
-    idio_sigma  = {t: float(rng.uniform(cfg.idio_sigma_min, cfg.idio_sigma_max)) for t in universe}
-    base_vol    = {t: int(rng.integers(cfg.base_volume_min, cfg.base_volume_max + 1)) for t in universe}
+    # Per-ticker parameters as arrays aligned with `universe`
+    N = len(universe)
+    market_beta = np.clip(rng.normal(cfg.market_beta_mean, cfg.market_beta_sd, size=N), 0.2, 2.2)
+    sector_beta = np.clip(rng.normal(cfg.sector_beta_mean, cfg.sector_beta_sd, size=N), 0.0, 1.5)
+    idio_sigma = rng.uniform(cfg.idio_sigma_min, cfg.idio_sigma_max, size=N)
+    base_vol = rng.integers(cfg.base_volume_min, cfg.base_volume_max + 1, size=N)
+
+    start_prices = np.exp(rng.normal(cfg.start_price_log_mu, cfg.start_price_log_sigma, size=N))
+    prices = np.maximum(2.0, start_prices)
 
-    start_prices = np.exp(rng.normal(cfg.start_price_log_mu, cfg.start_price_log_sigma, size=len(universe)))
-    prices = {t: float(max(2.0, p)) for t, p in zip(universe, start_prices)}
+    sector_idx = np.array([_SECTOR_IDX.get(sector_name_by_ticker[t], _SPEC_IDX) for t in universe])
+    sector_names = [SECTORS[i] for i in sector_idx]
+    company_names = [_company_name(sm, t) for t in universe]  # looked up once, reused for rows and news
+    is_spec = sector_idx == _SPEC_IDX
 
     dates = pd.bdate_range(cfg.start_date, cfg.end_date)
     regime = cfg.initial_regime
 
-    rows: List[Dict] = []
+    # Preallocated output columns: per-row values are written a day-slice at a time,
+    # per-day scalars are repeated across the universe once at the end
+    D = len(dates)
+    M = D * N
+    open_col = np.empty(M)
+    high_col = np.empty(M)
+    low_col = np.empty(M)
+    close_col = np.empty(M)
+    volume_col = np.empty(M, dtype=np.int64)
+    ret_col = np.empty(M)
+    sector_ret_col = np.empty(M)
+    shock_col = np.empty(M)
+    day_dates = np.empty(D, dtype=object)
+    day_regimes = np.empty(D, dtype=object)
+    day_macros = np.empty(D, dtype=object)
+    day_mkt = np.empty(D)
     news: List[Dict] = []
 
-    for d in dates:
+    for di, d in enumerate(dates):
         date_str = d.strftime("%Y-%m-%d")
-        regime = _next_regime(rng, regime)
+        regime = next_regime(rng, regime)
         mu_mkt = REGIMES[regime]["mu"]
         sig_mkt = REGIMES[regime]["sigma"]
 
         r_mkt = float(rng.normal(mu_mkt, sig_mkt))
-        sector_r = {s: float(rng.normal(0.0, 0.65 * sig_mkt)) for s in range(len(SECTORS))}
+        sector_r = rng.normal(0.0, 0.65 * sig_mkt, size=len(SECTORS))
 
         macro_headline = None
         if rng.random() < cfg.macro_news_prob:
-            macro_headline = _weighted_choice(
-                rng,
-                ["Inflation cools", "Inflation spikes", "Jobs surprise", "Rates repriced", "Geopolitical tension", "Soft landing talk"],
-                [0.16, 0.14, 0.18, 0.20, 0.16, 0.16],
-            )
-
-        for t in universe:
-            sector_name = sector_name_by_ticker.get(t, "Speculative")
-            sec = SECTORS.index(sector_name) if sector_name in SECTORS else SECTORS.index("Speculative")
-            id_sig = idio_sigma[t]
-
-            # News probability adjustments
-            p_news = cfg.news_prob_base
-            if regime == "crisis":
-                p_news *= cfg.news_prob_crisis_mult
-            if SECTORS[sec] == "Speculative":
-                p_news *= cfg.news_prob_spec_mult
-
-            shock_ret = 0.0
-            vol_mult = 1.0
-
-            # Optional ticker-level event
-            if rng.random() < p_news:
-                event_types = list(NEWS_EVENT_TYPES.keys())
-                weights = np.ones(len(event_types), dtype=float)
-
-                if SECTORS[sec] == "Speculative":
-                    for i, et in enumerate(event_types):
-                        if "meme" in et:
-                            weights[i] *= 2.2
-                if SECTORS[sec] == "Energy":
-                    for i, et in enumerate(event_types):
-                        if "macro_" in et:
-                            weights[i] *= 1.6
-                if regime == "crisis":
-                    for i, et in enumerate(event_types):
-                        if et in {"macro_headwind", "regulatory_risk", "lawsuit", "earnings_miss"}:
-                            weights[i] *= 1.5
-
-                etype = _weighted_choice(rng, event_types, weights.tolist())
-                spec = NEWS_EVENT_TYPES[etype]
-                lo, hi = spec["jump_range"]  # type: ignore
-                shock_ret = float(rng.uniform(lo, hi))
-                vol_mult = float(spec["vol_mult"])  # type: ignore
-
-                news.append({
-                    "date": date_str,
-                    "ticker": t,
-                    "company_name": _company_name(sm, t),
-                    "event_type": etype,
-                    "sentiment": spec["sentiment"],
-                    "headline": random_headline(rng, etype, t),
-                    "shock_return": shock_ret,
-                    "macro_context": macro_headline,
-                    "regime": regime,
-                })
-
-            r_sector = sector_r[sec]
-            r_idio = float(rng.normal(0.0, id_sig * vol_mult))
-            r_total = (market_beta[t] * r_mkt) + (sector_beta[t] * r_sector) + r_idio + shock_ret
-            r_total = float(np.clip(r_total, -0.35, 0.35))
-
-            prev_close = prices[t]
-
-            overnight = float(rng.normal(0.0, id_sig * cfg.overnight_sigma_mult))
-            open_px = prev_close * (1.0 + overnight)
-            close_px = open_px * (1.0 + r_total)
-
-            intraday_sig = (abs(r_total) + id_sig) * cfg.intraday_range_mult
-            hi_spread = abs(float(rng.normal(0.0, intraday_sig)))
-            lo_spread = abs(float(rng.normal(0.0, intraday_sig)))
-            high_px = max(open_px, close_px) * (1.0 + hi_spread)
-            low_px = min(open_px, close_px) * (1.0 - lo_spread)
-
-            vol_bump = 1.0 + 8.0 * min(0.08, abs(r_total))
-            if shock_ret != 0.0:
-                vol_bump *= 1.4
-            volume = int(max(1000, base_vol[t] * vol_bump * float(rng.uniform(0.75, 1.25))))
-
-            prices[t] = float(max(0.5, close_px))
-
-            rows.append({
+            macro_headline = sample_cdf(rng, MACRO_KEYS, MACRO_CDF)
+
+        # News probability adjustments
+        p_news = cfg.news_prob_base * np.where(is_spec, cfg.news_prob_spec_mult, 1.0)
+        if regime == "crisis":
+            p_news = p_news * cfg.news_prob_crisis_mult
+
+        shock_ret = np.zeros(N)
+        vol_mult = np.ones(N)
+
+        # Optional ticker-level events (rare, so sampled per news ticker)
+        for i in np.flatnonzero(rng.random(N) < p_news).tolist():
+            t = universe[i]
+            p_event = EVENT_PROBS[sector_idx[i], REGIME_IDX[regime]]
+            etype = EVENT_TYPES[int(rng.choice(len(EVENT_TYPES), p=p_event))]
+            spec = NEWS_EVENT_TYPES[etype]
+            lo, hi = spec["jump_range"]  # type: ignore
+            shock_ret[i] = float(rng.uniform(lo, hi))
+            vol_mult[i] = float(spec["vol_mult"])  # type: ignore
+
+            news.append({
                 "date": date_str,
                 "ticker": t,
-                "company_name": _company_name(sm, t),
-                "sector": SECTORS[sec],
+                "company_name": company_names[i],
+                "event_type": etype,
+                "sentiment": spec["sentiment"],
+                "headline": random_headline(rng, etype, t),
+                "shock_return": float(shock_ret[i]),
+                "macro_context": macro_headline,
                 "regime": regime,
-                "macro_headline": macro_headline,
-                "open": round(float(open_px), 4),
-                "high": round(float(high_px), 4),
-                "low": round(float(low_px), 4),
-                "close": round(float(close_px), 4),
-                "volume": volume,
-                "ret": round(float(r_total), 6),
-                "market_ret": round(float(r_mkt), 6),
-                "sector_ret": round(float(r_sector), 6),
-                "shock_ret": round(float(shock_ret), 6),
-                "has_news": int(shock_ret != 0.0),
             })
 
-    df = pd.DataFrame(rows).sort_values(["date", "ticker"])
+        # Bulk draws: idio, overnight, high spread, low spread
+        z = rng.standard_normal((4, N))
+        u_vol = rng.uniform(0.75, 1.25, size=N)
+
+        open_px, high_px, low_px, close_px, r_total, volume, prices = _day_kernel(
+            prices, market_beta, sector_beta, idio_sigma, base_vol, sector_idx, sector_r, r_mkt,
+            z[0], z[1], z[2], z[3], u_vol, shock_ret, vol_mult, cfg.overnight_sigma_mult, cfg.intraday_range_mult,
+        )
+        r_sector = sector_r[sector_idx]
+
+        day = slice(di * N, (di + 1) * N)
+        open_col[day] = open_px
+        high_col[day] = high_px
+        low_col[day] = low_px
+        close_col[day] = close_px
+        volume_col[day] = volume
+        ret_col[day] = r_total
+        sector_ret_col[day] = r_sector
+        shock_col[day] = shock_ret
+        day_dates[di] = date_str
+        day_regimes[di] = regime
+        day_macros[di] = macro_headline
+        day_mkt[di] = r_mkt
+
+    df = pd.DataFrame({
+        "date": np.repeat(day_dates, N),
+        "ticker": universe * D,
+        "company_name": company_names * D,
+        "sector": sector_names * D,
+        "regime": np.repeat(day_regimes, N),
+        "macro_headline": np.repeat(day_macros, N),
+        "open": open_col,
+        "high": high_col,
+        "low": low_col,
+        "close": close_col,
+        "volume": volume_col,
+        "ret": ret_col,
+        "market_ret": np.repeat(day_mkt, N),
+        "sector_ret": sector_ret_col,
+        "shock_ret": shock_col,
+        "has_news": (shock_col != 0.0).astype(int),
+    })
+    df = df.round(_ROUND_DECIMALS).sort_values(["date", "ticker"])
     return df, news
 
 def save_market_tape(df: pd.DataFrame, news: List[Dict], out_dir: str) -> Tuple[str, str]:
@@ -260,10 +272,13 @@ def save_market_tape(df: pd.DataFrame, news: List[Dict], out_dir: str) -> Tuple[
     prices_path = os.path.join(out_dir, "prices.csv")
     news_path = os.path.join(out_dir, "news.jsonl")
 
-    df.to_csv(prices_path, index=False)
+    write_csv(df, prices_path)  # native writer only with SIM_FAST_IO=1 (it changes the CSV text)
 
-    with open(news_path, "w", encoding="utf-8") as f:
-        for item in news:
-            f.write(json.dumps(item, ensure_ascii=False) + "\n")
+    if orjson is not None:
+        payload = b"".join(orjson.dumps(item) + b"\n" for item in news)
+    else:
+        payload = "".join(json.dumps(item, ensure_ascii=False) + "\n" for item in news).encode("utf-8")
+    with open(news_path, "wb") as f:
+        f.write(payload)
 
     return prices_path, news_path
@@ -1,35 +1,69 @@
 # simulator/orders.py
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+from typing import NamedTuple, Optional
 import pandas as pd
 
-@dataclass(frozen=True)
-class Order:
+try:  # optional: Arrow CSV reader + compute kernels for the SIM_FAST_IO path
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:  # pragma: no cover - depends on environment
+    pa = None
+
+from ._fastio import fast_io_enabled, read_csv_where
+
+_ORDER_COLS = ("date", "team", "ticker", "side", "qty")
+
+class Order(NamedTuple):
+    """
+    One parsed order row. A NamedTuple rather than a frozen dataclass: cheap to build in
+    bulk, immutable, and no per-instance __dict__ (dataclass slots=True needs Python 3.10).
+    """
     date: str
     team: str
     ticker: str
     side: str   # BUY/SELL
     qty: int
 
-def load_orders_csv(path: str) -> list[Order]:
+def load_orders_csv(path: str, date: Optional[str] = None) -> list[Order]:
     """
     Expected columns: date, team, ticker, side, qty
+    With `date`, only that day's orders are parsed into Orders (filtered while reading).
+    """
+    if fast_io_enabled() and pa is not None:
+        return _load_orders_arrow(path, date)
+
+    df = pd.read_csv(path) if date is None else read_csv_where(path, "date", str(date))
+    missing = set(_ORDER_COLS) - set(df.columns)
+    if missing:
+        raise ValueError(f"Orders CSV missing columns: {sorted(missing)}")
+
+    # Normalize whole columns, then build Orders from plain Python values
+    dates = df["date"].astype(str).tolist()
+    teams = df["team"].astype(str).tolist()
+    tickers = df["ticker"].astype(str).str.upper().str.strip().tolist()
+    sides = df["side"].astype(str).str.upper().str.strip().tolist()
+    qtys = df["qty"].astype("int64").tolist()
+    return [Order(*row) for row in zip(dates, teams, tickers, sides, qtys)]
+
+
+def _load_orders_arrow(path: str, date: Optional[str]) -> list[Order]:
+    """
+    load_orders_csv on an Arrow table: the date predicate and the text normalization run as
+    compute kernels, and only the surviving rows become Python values.
     """
-    df = pd.read_csv(path)
-    required = {"date", "team", "ticker", "side", "qty"}
-    missing = required - set(df.columns)
+    text_cols = {c: pa.string() for c in _ORDER_COLS if c != "qty"}
+    tbl = pacsv.read_csv(path, convert_options=pacsv.ConvertOptions(column_types=text_cols))
+    missing = set(_ORDER_COLS) - set(tbl.column_names)
     if missing:
         raise ValueError(f"Orders CSV missing columns: {sorted(missing)}")
 
-    orders: list[Order] = []
-    for _, r in df.iterrows():
-        orders.append(Order(
-            date=str(r["date"]),
-            team=str(r["team"]),
-            ticker=str(r["ticker"]).upper().strip(),
-            side=str(r["side"]).upper().strip(),
-            qty=int(r["qty"]),
-        ))
-    return orders
+    if date is not None:
+        tbl = tbl.filter(pc.equal(tbl["date"], str(date)))
+    dates = tbl["date"].to_pylist()
+    teams = tbl["team"].to_pylist()
+    tickers = pc.utf8_trim_whitespace(pc.utf8_upper(tbl["ticker"])).to_pylist()
+    sides = pc.utf8_trim_whitespace(pc.utf8_upper(tbl["side"])).to_pylist()
+    qtys = pc.cast(tbl["qty"], pa.int64()).to_pylist()
+    return [Order(*row) for row in zip(dates, teams, tickers, sides, qtys)]
@@ -18,7 +18,7 @@ class Portfolio:
 
 
     def position_value(self, prices: Dict[str, float]) -> float:
-        return sum(self.positions.get(sym, 0) * prices.get(sym, 0.0) for sym in self.positions)
+        return sum(q * prices.get(sym, 0.0) for sym, q in self.positions.items())
 
     def nav(self, prices: Dict[str, float]) -> float:
         return self.cash + self.position_value(prices)
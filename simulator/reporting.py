@@ -1,59 +1,91 @@
 # simulator/reporting.py
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
+from typing import Dict, List
+import numpy as np
 import pandas as pd
 
 from .portfolio import Portfolio
 
-def build_positions_report(portfolios: List[Portfolio], close_prices: Dict[str, float], date: str) -> pd.DataFrame:
-    rows = []
+_POSITION_COLS = ["date", "team", "ticker", "qty", "close", "avg_cost", "market_value", "weight", "unrealized_pnl"]
+_PNL_COLS = ["date", "team", "nav", "cash", "realized_pnl", "unrealized_pnl", "total_pnl", "total_return"]
+
+def _round(df: pd.DataFrame, decimals: Dict[str, int]) -> pd.DataFrame:
+    """
+    Round columns with Python's round(), which is correctly rounded on the float's exact value;
+    DataFrame.round scales, rints and unscales, and can land on the other side of a half-cent.
+    """
+    return df.assign(**{col: [round(v, nd) for v in df[col].tolist()] for col, nd in decimals.items()})
+
+def _positions_frame(portfolios: List[Portfolio], close_prices: Dict[str, float]) -> pd.DataFrame:
+    """
+    Long (team, ticker) frame of every holding with close, market value and unrealized P&L.
+    """
+    teams: List[str] = []
+    tickers: List[str] = []
+    qtys: List[int] = []
+    avgs: List[float] = []
     for p in portfolios:
-        nav = p.nav(close_prices)
-        for sym, qty in p.positions.items():
-            px = close_prices.get(sym, 0.0)
-            mv = qty * px
-            w = (mv / nav) if nav > 0 else 0.0
-            avg = p.avg_cost.get(sym, 0.0)
-            unreal = (px - avg) * qty
-            rows.append({
-                "date": date,
-                "team": p.team,
-                "ticker": sym,
-                "qty": qty,
-                "close": round(px, 4),
-                "avg_cost": round(avg, 4),
-                "market_value": round(mv, 2),
-                "weight": round(w, 6),
-                "unrealized_pnl": round(unreal, 2),
-            })
-    df = pd.DataFrame(rows)
-    if df.empty:
-        return df
+        teams.extend([p.team] * len(p.positions))
+        tickers.extend(p.positions)
+        qtys.extend(p.positions.values())
+        avgs.extend(p.avg_cost.get(s, 0.0) for s in p.positions)
+
+    pos = pd.DataFrame({
+        "team": teams,
+        "ticker": tickers,
+        "qty": np.array(qtys, dtype=np.int64),
+        "avg_cost": np.array(avgs, dtype=float),
+    })
+    pos["close"] = pos["ticker"].map(close_prices).astype(float).fillna(0.0)
+    pos["market_value"] = pos["qty"] * pos["close"]
+    pos["unrealized_pnl"] = (pos["close"] - pos["avg_cost"]) * pos["qty"]
+    return pos
+
+def _portfolio_sums(pos: pd.DataFrame, cols: List[str], portfolios: List[Portfolio]) -> Dict[str, np.ndarray]:
+    """
+    Per-portfolio totals of `cols` over its (contiguous) rows of `pos`, accumulated left to right
+    like Portfolio.nav's sum(); groupby/np.sum use compensated or pairwise sums, which can move
+    the last bit and with it a half-cent rounding.
+    """
+    counts = np.array([len(p.positions) for p in portfolios], dtype=np.int64)
+    ends = np.cumsum(counts)
+    starts = ends - counts
+    out = {}
+    for col in cols:
+        vals = pos[col].to_numpy()
+        out[col] = np.array([vals[a:b].cumsum()[-1] if b > a else 0.0 for a, b in zip(starts, ends)])
+    return out
+
+def build_positions_report(portfolios: List[Portfolio], close_prices: Dict[str, float], date: str) -> pd.DataFrame:
+    pos = _positions_frame(portfolios, close_prices)
+    if pos.empty:
+        return pd.DataFrame()
+
+    held = _portfolio_sums(pos, ["market_value"], portfolios)["market_value"]
+    cash = np.array([p.cash for p in portfolios], dtype=float)
+    nav = np.repeat(cash + held, [len(p.positions) for p in portfolios])
+    pos["weight"] = np.where(nav > 0, pos["market_value"] / nav, 0.0)
+    pos["date"] = date
+
+    df = _round(pos[_POSITION_COLS], {"close": 4, "avg_cost": 4, "market_value": 2, "weight": 6, "unrealized_pnl": 2})
     return df.sort_values(["team", "market_value"], ascending=[True, False])
 
 def build_pnl_report(portfolios: List[Portfolio], close_prices: Dict[str, float], date: str, initial_cash: float) -> pd.DataFrame:
-    rows = []
-    for p in portfolios:
-        nav = p.nav(close_prices)
-        unreal = 0.0
-        for sym, qty in p.positions.items():
-            px = close_prices.get(sym, 0.0)
-            avg = p.avg_cost.get(sym, 0.0)
-            unreal += (px - avg) * qty
-
-        total_pnl = (nav - initial_cash)
-        rows.append({
-            "date": date,
-            "team": p.team,
-            "nav": round(nav, 2),
-            "cash": round(p.cash, 2),
-            "realized_pnl": round(p.realized_pnl, 2),
-            "unrealized_pnl": round(unreal, 2),
-            "total_pnl": round(total_pnl, 2),
-            "total_return": round(total_pnl / initial_cash, 6),
-        })
-    df = pd.DataFrame(rows)
-    if df.empty:
-        return df
+    if not portfolios:
+        return pd.DataFrame()
+    sums = _portfolio_sums(_positions_frame(portfolios, close_prices), ["market_value", "unrealized_pnl"], portfolios)
+
+    df = pd.DataFrame({
+        "date": date,
+        "team": [p.team for p in portfolios],
+        "cash": [p.cash for p in portfolios],
+        "realized_pnl": [p.realized_pnl for p in portfolios],
+        "unrealized_pnl": sums["unrealized_pnl"],
+    })
+    df["nav"] = df["cash"] + sums["market_value"]
+    df["total_pnl"] = df["nav"] - initial_cash
+    df["total_return"] = df["total_pnl"] / initial_cash
+
+    df = _round(df[_PNL_COLS], {"nav": 2, "cash": 2, "realized_pnl": 2, "unrealized_pnl": 2, "total_pnl": 2, "total_return": 6})
     return df.sort_values("nav", ascending=False)
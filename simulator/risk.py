@@ -4,6 +4,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, Tuple
 
+import numpy as np
+
 from .portfolio import Portfolio
 
 @dataclass(frozen=True)
@@ -27,39 +29,49 @@ def check_order_weight_limit(
     if nav_before <= 0:
         return False, "NAV_NONPOSITIVE"
 
-    # Build a temporary position dict
-    new_positions = dict(portfolio.positions)
-    cur_qty = new_positions.get(ticker, 0)
+    # A cap of 100%+ can't bind on a long-only book with non-negative cash, so past the NAV and
+    # order-shape checks there is nothing left to evaluate
+    weight_capped = cfg.max_position_weight < 1.0
+
+    positions = portfolio.positions
+    cur_qty = positions.get(ticker, 0)
 
     if side == "BUY":
-        new_positions[ticker] = cur_qty + qty
+        new_qty = cur_qty + qty
     elif side == "SELL":
-        new_positions[ticker] = cur_qty - qty
-        if new_positions[ticker] < 0:
+        new_qty = cur_qty - qty
+        if new_qty < 0:
             return False, "SHORT_NOT_ALLOWED"
     else:
         return False, "BAD_SIDE"
+    if not weight_capped:
+        return True, "OK"
 
-    # Compute NAV after trade approximately (cash changes but for weight test, NAV is close enough)
-    # More accurate would adjust cash, but weight cap is mainly about concentration.
-    # We'll compute market value using exec_price for the traded ticker, close for others.
-    total_value = portfolio.cash  # approximate
-    for sym, q in new_positions.items():
-        if q == 0:
-            continue
-        px = exec_price if sym == ticker else close_prices.get(sym, 0.0)
-        total_value += q * px
+    # Post-trade holdings as aligned arrays (dict order, traded ticker appended if new).
+    # Market value uses exec_price for the traded ticker, close for others; cash is left
+    # as-is, since the weight cap is mainly about concentration.
+    syms = list(positions)
+    n = len(syms)
+    qtys = np.fromiter(positions.values(), dtype=float, count=n)
+    pxs = np.fromiter((close_prices.get(s, 0.0) for s in syms), dtype=float, count=n)
+    if ticker in positions:
+        i = syms.index(ticker)
+    else:
+        syms.append(ticker)
+        qtys = np.append(qtys, 0.0)
+        pxs = np.append(pxs, 0.0)
+        i = n
+    qtys[i] = new_qty
+    pxs[i] = exec_price
 
+    mv = qtys * pxs
+    total_value = portfolio.cash + float(mv.sum())  # approximate
     if total_value <= 0:
         return False, "NAV_AFTER_NONPOSITIVE"
 
     # Check max weight
-    for sym, q in new_positions.items():
-        if q == 0:
-            continue
-        px = exec_price if sym == ticker else close_prices.get(sym, 0.0)
-        w = (q * px) / total_value
-        if w > cfg.max_position_weight + 1e-9:
-            return False, f"POSITION_WEIGHT_LIMIT_{sym}"
+    over = mv / total_value > cfg.max_position_weight + 1e-9
+    if over.any():
+        return False, f"POSITION_WEIGHT_LIMIT_{syms[int(np.argmax(over))]}"
 
     return True, "OK"
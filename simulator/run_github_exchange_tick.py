@@ -9,17 +9,19 @@ from .live_tape import BAR_HOURS  # uses your 10..16 schedule
 import argparse
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Any, Optional
 
 import pandas as pd
 
 from .live_tape import LiveTapeConfig, load_or_create_state, save_state, step_one_bar, append_outputs
 from .execution import ExecConfig, apply_slippage
-from .state_io import load_portfolio, save_portfolio
+from .state_io import list_portfolio_teams, load_portfolio, save_portfolio
+from .portfolio import Portfolio
 from .risk import RiskConfig, check_order_weight_limit
 from .reporting import build_positions_report, build_pnl_report
 from .limit_fill import limit_order_fills, limit_fill_price
-from .dashboard_snapshot import build_latest_prices_snapshot, build_latest_news_snapshot
+from .dashboard_snapshot import build_latest_prices_snapshot, build_latest_news_snapshot, write_json
 
 from .github_issue_parser import parse_order_from_issue_body, ParsedOrder
 
@@ -56,6 +58,36 @@ def _load_issues(path: str) -> List[Dict[str, Any]]:
     return obj.get("issues", obj)
 
 
+def _parse_issue(it: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Parse one issue into {"issue_number", "created_at", "user", "order"|"error"}.
+    """
+    body = (it.get("body") or "").strip()
+    out: Dict[str, Any] = {
+        "issue_number": it.get("number"),
+        "created_at": it.get("created_at"),
+        "user": (it.get("user") or {}).get("login"),
+    }
+    try:
+        out["order"] = parse_order_from_issue_body(body)
+    except Exception as e:
+        out["error"] = str(e)
+    return out
+
+
+# Parsing is ~15us per issue, so a process pool only pays off for large batches
+_PARALLEL_PARSE_MIN = 20_000
+
+
+def _parse_issues(issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    workers = os.cpu_count() or 1
+    if len(issues) < _PARALLEL_PARSE_MIN or workers < 2:
+        return [_parse_issue(it) for it in issues]
+    chunksize = max(1, len(issues) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(_parse_issue, issues, chunksize=chunksize))
+
+
 def is_exchange_open(tz: str = "America/Chicago") -> bool:
     now = datetime.now(ZoneInfo(tz))
     # 0=Mon ... 6=Sun
@@ -88,8 +120,10 @@ def main() -> None:
     save_state(live_cfg, market_state)
 
     # Lookups for this bar (execution at this bar close)
-    px_by_ticker: Dict[str, Dict] = {r["ticker"]: r for _, r in bar_df.iterrows()}
-    close_prices: Dict[str, float] = {t: float(px_by_ticker[t]["close"]) for t in px_by_ticker}
+    bar_by_ticker = bar_df.set_index("ticker")
+    close_prices: Dict[str, float] = bar_by_ticker["close"].astype(float).to_dict()
+    high_prices: Dict[str, float] = bar_by_ticker["high"].astype(float).to_dict()
+    low_prices: Dict[str, float] = bar_by_ticker["low"].astype(float).to_dict()
 
     exec_cfg = ExecConfig(fee_per_trade=float(args.fee), slippage_bps=float(args.slippage_bps), execution_price="close")
     risk_cfg = RiskConfig(max_position_weight=float(args.max_pos_w))
@@ -98,28 +132,7 @@ def main() -> None:
     issues = _load_issues(args.orders_json)
 
     # Parse orders
-    parsed: List[Dict[str, Any]] = []
-    for it in issues:
-        body = (it.get("body") or "").strip()
-        number = it.get("number")
-        created_at = it.get("created_at")
-        user = (it.get("user") or {}).get("login")
-
-        try:
-            order: ParsedOrder = parse_order_from_issue_body(body)
-            parsed.append({
-                "issue_number": number,
-                "created_at": created_at,
-                "user": user,
-                "order": order,
-            })
-        except Exception as e:
-            parsed.append({
-                "issue_number": number,
-                "created_at": created_at,
-                "user": user,
-                "error": str(e),
-            })
+    parsed = _parse_issues(issues)
 
     # Keep only valid orders
     valid = [x for x in parsed if "order" in x]
@@ -128,23 +141,25 @@ def main() -> None:
     #   - any order submitted since last tick is executed at THIS tick close
     teams = sorted(set(x["order"].team for x in valid))
     trade_log_rows = []
+    loaded: Dict[str, Portfolio] = {}
 
     for team in teams:
         p = load_portfolio(args.state_dir, team, args.initial_cash)
+        loaded[team] = p
 
         team_orders = [x for x in valid if x["order"].team == team]
         for x in team_orders:
             o: ParsedOrder = x["order"]
             issue_no = x["issue_number"]
 
-            if o.ticker not in px_by_ticker:
+            if o.ticker not in close_prices:
                 trade_log_rows.append({"timestamp": ts, "team": team, "ticker": o.ticker, "side": o.side, "qty": o.qty,
                                        "issue": issue_no, "status": "REJECT_NO_PRICE"})
                 continue
 
-            bar_high = float(px_by_ticker[o.ticker]["high"])
-            bar_low = float(px_by_ticker[o.ticker]["low"])
-            bar_close = float(px_by_ticker[o.ticker]["close"])
+            bar_high = high_prices[o.ticker]
+            bar_low = low_prices[o.ticker]
+            bar_close = close_prices[o.ticker]
 
             if o.order_type == "LIMIT":
                 assert o.limit_price is not None
@@ -180,7 +195,7 @@ def main() -> None:
 
                 trade_log_rows.append({
                     "timestamp": ts, "team": team, "ticker": o.ticker, "side": o.side, "qty": o.qty,
-                    "price": round(exec_px, 4), "fee": exec_cfg.fee_per_trade, "issue": issue_no,
+                    "price": exec_px, "fee": exec_cfg.fee_per_trade, "issue": issue_no,
                     "status": "FILLED", "order_type": o.order_type, "limit_price": o.limit_price
                 })
             except Exception as e:
@@ -190,11 +205,11 @@ def main() -> None:
         save_portfolio(args.state_dir, p)
 
     # 3) Reporting
-    portfolios: List = []
-    for fn in os.listdir(args.state_dir):
-        if fn.startswith("portfolio_") and fn.endswith(".json"):
-            team = fn[len("portfolio_"):-len(".json")]
-            portfolios.append(load_portfolio(args.state_dir, team, args.initial_cash))
+    # Teams traded this tick are already in memory; only the rest are read back
+    portfolios: List[Portfolio] = [
+        loaded[team] if team in loaded else load_portfolio(args.state_dir, team, args.initial_cash)
+        for team in list_portfolio_teams(args.state_dir)
+    ]
 
     date_only = ts.split(" ")[0]
     pos_df = build_positions_report(portfolios, close_prices, date_only)
@@ -211,7 +226,7 @@ def main() -> None:
 
     # trades
     if trade_log_rows:
-        trade_log = pd.DataFrame(trade_log_rows)
+        trade_log = pd.DataFrame(trade_log_rows).round({"price": 4})
         trade_path = os.path.join(args.leaderboards_dir, f"trades_{ts.replace(':','-').replace(' ','_')}.csv")
         trade_log.to_csv(trade_path, index=False)
 
@@ -231,8 +246,7 @@ def main() -> None:
     build_latest_news_snapshot(args.news_out, latest_news_json)
 
     # leaderboard json
-    with open(leaderboard_json, "w", encoding="utf-8") as f:
-        json.dump({"timestamp": ts, "rows": pnl_df.to_dict(orient="records")}, f, indent=2)
+    write_json(leaderboard_json, {"timestamp": ts, "rows": pnl_df.to_dict(orient="records")})
 
     print(f"✅ Exchange tick complete: {ts}")
     print(f"Orders processed: {len(valid)} (issues parsed from {len(issues)})")
@@ -5,14 +5,21 @@ from .risk import RiskConfig, check_order_weight_limit
 
 import argparse
 import os
-from typing import Dict
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
 
 import pandas as pd
 
+from ._fastio import write_csv
 from .execution import ExecConfig, apply_slippage, get_execution_price
-from .orders import load_orders_csv
-from .state_io import load_portfolio, save_portfolio
-from .market_data import load_prices, load_news_jsonl, get_day_prices, get_day_news
+from .orders import Order, load_orders_csv
+from .portfolio import Portfolio
+from .state_io import (
+    ACCOUNTS_TABLE, POSITIONS_TABLE, has_portfolio_tables, list_portfolio_teams, load_all_portfolios,
+    load_portfolio, save_all_portfolios, save_portfolio,
+)
+from .market_data import load_prices, load_news_for_date, get_day_prices
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -29,13 +36,117 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--out_dir", default="data/leaderboards", help="Output folder for leaderboard + trades")
     p.add_argument("--print_news", action="store_true", help="Print today's news headlines")
     p.add_argument("--reports_dir", default="data/reports", help="Output folder for positions/pnl reports")
-    p.add_argument("--max_pos_w", type=float, default=0.20, help="Max position weight (e.g., 0.20 = 20%)")
+    p.add_argument("--max_pos_w", type=float, default=0.20, help="Max position weight (e.g., 0.20 = 20%%; >= 1.0 turns the weight check off)")
+    p.add_argument("--state_format", default="json", choices=["json", "parquet"],
+                   help="json: one file per team; parquet: all teams in two tables (needs pyarrow). Teams missing "
+                        "from the tables are read from their JSON files, so a JSON state dir carries over; once the "
+                        "tables exist, json is refused (its per-team files are no longer updated)")
+    p.add_argument("--workers", type=int, default=1,
+                   help="Processes for per-team execution (1 = serial, 0 = one per CPU)")
 
     return p
 
 
-def main() -> None:
-    args = build_parser().parse_args()
+_PARSER = build_parser()
+
+
+@dataclass
+class RunArgs:
+    """run_session settings; field names and defaults mirror the CLI flags."""
+    date: str
+    prices: str = "data/market/prices.csv"
+    news: str = "data/market/news.jsonl"
+    orders: str = "students/orders.csv"
+    state_dir: str = "data/state"
+    initial_cash: float = 100000.0
+    exec_price: str = "close"
+    fee: float = 1.0
+    slippage_bps: float = 5.0
+    out_dir: str = "data/leaderboards"
+    print_news: bool = False
+    reports_dir: str = "data/reports"
+    max_pos_w: float = 0.20
+    state_format: str = "json"
+    workers: int = 1
+
+
+# Trade-log row layout; rejected orders leave price and fee empty
+_TRADE_LOG_COLS = ("date", "team", "ticker", "side", "qty", "price", "fee", "status")
+
+
+def _process_team(
+    p: Portfolio,
+    team_orders: List[Order],
+    px_by_ticker: Dict[str, Dict],
+    close_prices: Dict[str, float],
+    exec_cfg: ExecConfig,
+    risk_cfg: RiskConfig,
+    date: str,
+) -> Tuple[Portfolio, List[Tuple]]:
+    """Apply one team's orders for the day; returns the updated portfolio and its trade-log rows."""
+    team = p.team
+    rows: List[Tuple] = []
+    # Loop-invariant lookups hoisted to locals
+    append = rows.append
+    price_field = exec_cfg.execution_price
+    slippage_bps = exec_cfg.slippage_bps
+    fee = exec_cfg.fee_per_trade
+    buy, sell = p.buy, p.sell
+    for o in team_orders:
+        ticker, side, qty = o.ticker, o.side, o.qty
+        px_row = px_by_ticker.get(ticker)
+        if px_row is None:
+            append((date, team, ticker, side, qty, None, None, "REJECT_NO_PRICE"))
+            continue
+
+        exec_px = apply_slippage(get_execution_price(px_row, price_field), side, slippage_bps)
+        ok, reason = check_order_weight_limit(
+            portfolio=p,
+            ticker=ticker,
+            side=side,
+            qty=qty,
+            exec_price=exec_px,
+            close_prices=close_prices,
+            cfg=risk_cfg,
+        )
+        if not ok:
+            append((date, team, ticker, side, qty, None, None, f"REJECT_{reason}"))
+            continue
+
+        try:
+            if side == "BUY":
+                buy(ticker, qty, exec_px, fee=fee)
+            elif side == "SELL":
+                sell(ticker, qty, exec_px, fee=fee)
+            else:
+                raise ValueError("side must be BUY or SELL")
+
+            append((date, team, ticker, side, qty, exec_px, fee, "FILLED"))
+        except Exception as e:
+            append((date, team, ticker, side, qty, None, None, f"REJECT_{type(e).__name__}"))
+
+    return p, rows
+
+
+def _process_teams(jobs: List[Tuple], workers: int) -> List[Tuple[Portfolio, List[Tuple]]]:
+    """Run _process_team over independent teams, in a process pool when workers > 1."""
+    if workers <= 1 or len(jobs) < 2:
+        return [_process_team(*job) for job in jobs]
+    workers = min(workers, len(jobs))
+    # Chunk the teams so the shared price dicts are pickled a few times per worker, not once per team
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(_process_team, *zip(*jobs), chunksize=chunksize))
+
+
+def run(args: RunArgs) -> None:
+    """One trading day; callable without argparse (tests, batch drivers)."""
+    if args.state_format == "json" and has_portfolio_tables(args.state_dir):
+        raise ValueError(
+            f"{args.state_dir} holds a parquet portfolio store, newer than its per-team JSON files; "
+            f"run with --state_format parquet (or remove {ACCOUNTS_TABLE} and {POSITIONS_TABLE} "
+            f"to go back to the JSON files as they were last written)"
+        )
     os.makedirs(args.out_dir, exist_ok=True)
     os.makedirs(args.reports_dir, exist_ok=True)
     risk_cfg = RiskConfig(max_position_weight=float(args.max_pos_w))
@@ -47,13 +158,11 @@ def main() -> None:
         execution_price=str(args.exec_price),
     )
 
-    prices_df = load_prices(args.prices)
-    news_rows = load_news_jsonl(args.news)
-
-    day_px = get_day_prices(prices_df, args.date)
-    day_news = get_day_news(news_rows, args.date)
+    prices_df = load_prices(args.prices, date=args.date)
+    day_px = get_day_prices(prices_df, args.date)  # raises if the date has no bars
 
     if args.print_news:
+        day_news = load_news_for_date(args.news, args.date)
         print(f"\n=== NEWS for {args.date} ({len(day_news)} items) ===")
         for n in day_news[:30]:
             ticker = n.get("ticker")
@@ -66,113 +175,72 @@ def main() -> None:
         print("=== END NEWS ===\n")
 
     # Price lookup for the day
-    px_by_ticker: Dict[str, Dict] = {r["ticker"]: r for _, r in day_px.iterrows()}
-    close_prices: Dict[str, float] = {t: float(px_by_ticker[t]["close"]) for t in px_by_ticker}
+    day_by_ticker = day_px.set_index("ticker")
+    px_by_ticker: Dict[str, Dict] = day_by_ticker.to_dict(orient="index")
+    close_prices: Dict[str, float] = day_by_ticker["close"].astype(float).to_dict()
 
-    orders_all = load_orders_csv(args.orders)
-    orders = [o for o in orders_all if o.date == args.date]
+    orders = load_orders_csv(args.orders, date=args.date)
 
     if not orders:
         print(f"No orders for {args.date}. (Looked in {args.orders})")
 
-    teams = sorted(set(o.team for o in orders)) if orders else []
+    orders_by_team: Dict[str, List[Order]] = {}
+    for o in orders:
+        orders_by_team.setdefault(o.team, []).append(o)
 
     trade_log_rows = []
 
-    for team in teams:
-        p = load_portfolio(args.state_dir, team, args.initial_cash)
-
-        team_orders = [o for o in orders if o.team == team]
-        for o in team_orders:
-            if o.ticker not in px_by_ticker:
-                trade_log_rows.append({
-                    "date": args.date, "team": team, "ticker": o.ticker, "side": o.side, "qty": o.qty,
-                    "status": "REJECT_NO_PRICE"
-                })
-                continue
-
-            px_row = px_by_ticker[o.ticker]
-            raw_px = get_execution_price(px_row, exec_cfg.execution_price)
-            exec_px = apply_slippage(raw_px, o.side, exec_cfg.slippage_bps)
-            ok, reason = check_order_weight_limit(
-                portfolio=p,
-                ticker=o.ticker,
-                side=o.side,
-                qty=o.qty,
-                exec_price=exec_px,
-                close_prices=close_prices,
-                cfg=risk_cfg,
-            )
-            if not ok:
-                trade_log_rows.append({
-                    "date": args.date, "team": team, "ticker": o.ticker, "side": o.side, "qty": o.qty,
-                    "status": f"REJECT_{reason}"
-                })
-                continue
-
-            try:
-                if o.side == "BUY":
-                    p.buy(o.ticker, o.qty, exec_px, fee=exec_cfg.fee_per_trade)
-                elif o.side == "SELL":
-                    p.sell(o.ticker, o.qty, exec_px, fee=exec_cfg.fee_per_trade)
-                else:
-                    raise ValueError("side must be BUY or SELL")
-
-                trade_log_rows.append({
-                    "date": args.date, "team": team, "ticker": o.ticker, "side": o.side, "qty": o.qty,
-                    "price": round(exec_px, 4), "fee": exec_cfg.fee_per_trade,
-                    "status": "FILLED"
-                })
-            except Exception as e:
-                trade_log_rows.append({
-                    "date": args.date, "team": team, "ticker": o.ticker, "side": o.side, "qty": o.qty,
-                    "status": f"REJECT_{type(e).__name__}"
-                })
-
-        save_portfolio(args.state_dir, p)
-
-    # Leaderboard from saved portfolios
-    leaderboard_rows = []
-    for fn in os.listdir(args.state_dir) if os.path.isdir(args.state_dir) else []:
-        if not (fn.startswith("portfolio_") and fn.endswith(".json")):
-            continue
-        team = fn[len("portfolio_"):-len(".json")]
-        p = load_portfolio(args.state_dir, team, args.initial_cash)
-        nav = p.nav(close_prices)
-        leaderboard_rows.append({
-            "date": args.date,
-            "team": team,
-            "nav": round(nav, 2),
-            "cash": round(p.cash, 2),
-            "realized_pnl": round(p.realized_pnl, 2),
-        })
-
-    # Load portfolios (again) for reporting
-    portfolios = []
-    for fn in os.listdir(args.state_dir) if os.path.isdir(args.state_dir) else []:
-        if fn.startswith("portfolio_") and fn.endswith(".json"):
-            team = fn[len("portfolio_"):-len(".json")]
-            portfolios.append(load_portfolio(args.state_dir, team, args.initial_cash))
+    batch_state = args.state_format == "parquet"
+    loaded: Dict[str, Portfolio] = load_all_portfolios(args.state_dir) if batch_state else {}
+
+    # Teams not in the parquet tables yet (e.g. the first parquet run on a JSON state dir)
+    # come from their portfolio_<team>.json, or start fresh if they have none
+    for team in sorted(orders_by_team):
+        if team not in loaded:
+            loaded[team] = load_portfolio(args.state_dir, team, args.initial_cash)
+
+    # Teams share no state during the day, so each one can clear on its own worker
+    workers = args.workers or os.cpu_count() or 1
+    jobs = [
+        (loaded[team], orders_by_team[team], px_by_ticker, close_prices, exec_cfg, risk_cfg, args.date)
+        for team in sorted(orders_by_team)
+    ]
+    for p, rows in _process_teams(jobs, workers):
+        loaded[p.team] = p
+        trade_log_rows.extend(rows)
+        if not batch_state:
+            save_portfolio(args.state_dir, p)
+
+    # Every saved portfolio, read once: teams that traded today (or came from the tables)
+    # are already in memory
+    for team in list_portfolio_teams(args.state_dir):
+        if team not in loaded:
+            loaded[team] = load_portfolio(args.state_dir, team, args.initial_cash)
+    if batch_state:
+        save_all_portfolios(args.state_dir, [loaded[team] for team in sorted(loaded)])
+    portfolios = [loaded[team] for team in sorted(loaded)]
 
     pos_df = build_positions_report(portfolios, close_prices, args.date)
     pnl_df = build_pnl_report(portfolios, close_prices, args.date, args.initial_cash)
 
     pos_path = os.path.join(args.reports_dir, f"positions_{args.date}.csv")
     pnl_path = os.path.join(args.reports_dir, f"pnl_{args.date}.csv")
-    pos_df.to_csv(pos_path, index=False)
-    pnl_df.to_csv(pnl_path, index=False)
+    write_csv(pos_df, pos_path)
+    write_csv(pnl_df, pnl_path)
     print(f"Positions report: {pos_path}")
     print(f"PnL report:       {pnl_path}")
 
-    lb = pd.DataFrame(leaderboard_rows).sort_values("nav", ascending=False)
+    # Leaderboard: team NAVs come from the P&L report's one-frame valuation (already nav-sorted)
+    lb_cols = ["date", "team", "nav", "cash", "realized_pnl"]
+    lb = pnl_df[lb_cols] if not pnl_df.empty else pd.DataFrame(columns=lb_cols)
 
     lb_path = os.path.join(args.out_dir, "leaderboard.csv")
-    lb.to_csv(lb_path, index=False)
+    write_csv(lb, lb_path)
 
     if trade_log_rows:
-        trade_log = pd.DataFrame(trade_log_rows)
+        trade_log = pd.DataFrame(trade_log_rows, columns=list(_TRADE_LOG_COLS)).round({"price": 4})
         trade_path = os.path.join(args.out_dir, f"trades_{args.date}.csv")
-        trade_log.to_csv(trade_path, index=False)
+        write_csv(trade_log, trade_path)
         print(f"Trades saved: {trade_path}")
 
     print(f"Leaderboard saved: {lb_path}")
@@ -180,5 +248,9 @@ def main() -> None:
         print(lb.head(10).to_string(index=False))
 
 
+def main() -> None:
+    run(RunArgs(**vars(_PARSER.parse_args())))
+
+
 if __name__ == "__main__":
     main()
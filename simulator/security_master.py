@@ -3,10 +3,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 import pandas as pd
 
+from ._fastio import read_csv
+
 
 @dataclass(frozen=True)
 class Security:
@@ -33,59 +35,79 @@ class SecurityMaster:
         if not self.csv_path.exists():
             raise FileNotFoundError(f"Security master CSV not found: {self.csv_path}")
 
-        df = pd.read_csv(self.csv_path)
+        df = read_csv(self.csv_path)
 
         required = {"symbol", "companyName", "industry", "sector", "country"}
         missing = required - set(df.columns)
         if missing:
             raise ValueError(f"Security master missing required columns: {sorted(missing)}")
 
-        # Normalize symbols
-        df["symbol"] = df["symbol"].astype(str).str.upper().str.strip()
-
-        self._by_symbol: Dict[str, Security] = {}
-
-        for _, row in df.iterrows():
-            sym = str(row["symbol"]).upper().strip()
-            if not sym:
-                continue
-
-            fte = None
-            if "fullTimeEmployees" in df.columns:
-                try:
-                    v = row.get("fullTimeEmployees")
-                    if pd.notna(v):
-                        fte = int(v)
-                except Exception:
-                    fte = None
-
-            desc = None
-            if "description" in df.columns:
-                v = row.get("description")
-                if pd.notna(v):
-                    desc = str(v)
-
-            sec = Security(
-                symbol=sym,
-                company_name=str(row.get("companyName", "")) if pd.notna(row.get("companyName")) else "",
-                sector=str(row.get("sector", "")) if pd.notna(row.get("sector")) else "Unknown",
-                industry=str(row.get("industry", "")) if pd.notna(row.get("industry")) else "Unknown",
-                country=str(row.get("country", "")) if pd.notna(row.get("country")) else "Unknown",
-                full_time_employees=fte,
-                description=desc,
-            )
-            self._by_symbol[sym] = sec
+        # Normalize whole columns up front; the loop below only sees clean Python values
+        n = len(df)
+        syms = df["symbol"].fillna("").astype(str).str.upper().str.strip().tolist()
+        names = self._text_col(df["companyName"], "")
+        sectors = self._text_col(df["sector"], "Unknown")
+        industries = self._text_col(df["industry"], "Unknown")
+        countries = self._text_col(df["country"], "Unknown")
+
+        if "fullTimeEmployees" in df.columns:
+            fte_num = pd.to_numeric(df["fullTimeEmployees"], errors="coerce")
+            ftes = [None if pd.isna(v) else int(v) for v in fte_num.tolist()]
+        else:
+            ftes = [None] * n
+
+        if "description" in df.columns:
+            descs = self._text_col(df["description"], None)
+        else:
+            descs = [None] * n
+
+        # One dict per field (struct of arrays); Security objects are only built by get()
+        keep = [i for i, sym in enumerate(syms) if sym]
+        syms = [syms[i] for i in keep]
+        self._name: Dict[str, str] = dict(zip(syms, (names[i] for i in keep)))
+        self._sector: Dict[str, str] = dict(zip(syms, (sectors[i] for i in keep)))
+        self._industry: Dict[str, str] = dict(zip(syms, (industries[i] for i in keep)))
+        self._country: Dict[str, str] = dict(zip(syms, (countries[i] for i in keep)))
+        self._fte: Dict[str, Optional[int]] = dict(zip(syms, (ftes[i] for i in keep)))
+        self._desc: Dict[str, Optional[str]] = dict(zip(syms, (descs[i] for i in keep)))
+
+    @staticmethod
+    def _text_col(col: pd.Series, default: Optional[str]) -> List[Optional[str]]:
+        """
+        Column as a list of str, with missing values replaced by `default`.
+        """
+        return col.astype(str).astype(object).where(col.notna(), default).tolist()
+
+    def _security(self, sym: str) -> Security:
+        return Security(
+            symbol=sym,
+            company_name=self._name[sym],
+            sector=self._sector[sym],
+            industry=self._industry[sym],
+            country=self._country[sym],
+            full_time_employees=self._fte[sym],
+            description=self._desc[sym],
+        )
+
+    def _key(self, symbol: str) -> str:
+        # Callers usually pass canonical symbols already; only normalize on a miss
+        return symbol if symbol in self._name else symbol.upper().strip()
 
     def get(self, symbol: str) -> Optional[Security]:
-        return self._by_symbol.get(symbol.upper().strip())
+        sym = self._key(symbol)
+        return self._security(sym) if sym in self._name else None
 
     def sector_of(self, symbol: str, default: str = "Unknown") -> str:
-        sec = self.get(symbol)
-        return sec.sector if sec and sec.sector else default
+        sector = self._sector.get(symbol)
+        if sector is None:
+            sector = self._sector.get(symbol.upper().strip())
+        return sector or default
 
     def company_name_of(self, symbol: str, default: str = "") -> str:
-        sec = self.get(symbol)
-        return sec.company_name if sec and sec.company_name else default
+        name = self._name.get(symbol)
+        if name is None:
+            name = self._name.get(symbol.upper().strip())
+        return name or default
 
     def as_dict(self) -> Dict[str, Security]:
-        return dict(self._by_symbol)
+        return {sym: self._security(sym) for sym in self._name}
@@ -4,28 +4,68 @@ from __future__ import annotations
 import json
 import os
 from dataclasses import asdict
-from typing import Dict
+from typing import Dict, List
+
+import pandas as pd
 
 from .portfolio import Portfolio
 
+try:  # optional: C JSON codec
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+# Columnar store for all teams at once (see save_all_portfolios)
+ACCOUNTS_TABLE = "portfolios.parquet"
+POSITIONS_TABLE = "positions.parquet"
+
 def ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 def portfolio_path(state_dir: str, team: str) -> str:
     return os.path.join(state_dir, f"portfolio_{team}.json")
 
+def list_portfolio_teams(state_dir: str) -> List[str]:
+    """
+    Teams with a saved portfolio_<team>.json, from one directory scan.
+    """
+    if not os.path.isdir(state_dir):
+        return []
+    # scandir's DirEntry answers is_file() from the directory listing, without a stat per file
+    with os.scandir(state_dir) as it:
+        teams = [
+            e.name[len("portfolio_"):-len(".json")]
+            for e in it
+            if e.name.startswith("portfolio_") and e.name.endswith(".json") and e.is_file()
+        ]
+    return sorted(teams)
+
 def save_portfolio(state_dir: str, p: Portfolio) -> None:
     ensure_dir(state_dir)
-    with open(portfolio_path(state_dir, p.team), "w", encoding="utf-8") as f:
-        json.dump(asdict(p), f, indent=2)
+    path = portfolio_path(state_dir, p.team)
+    if orjson is not None:
+        data = orjson.dumps(asdict(p), option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(asdict(p), indent=2).encode("utf-8")
+    if os.path.exists(path):
+        # Unchanged portfolio (e.g. no fills today): leave the file and its mtime alone
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return
+
+    # Write-then-rename so a crash mid-write never leaves a truncated portfolio behind
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
 
 def load_portfolio(state_dir: str, team: str, initial_cash: float) -> Portfolio:
     path = portfolio_path(state_dir, team)
     if not os.path.exists(path):
         return Portfolio(team=team, cash=float(initial_cash))
 
-    with open(path, "r", encoding="utf-8") as f:
-        d = json.load(f)
+    with open(path, "rb") as f:
+        d = orjson.loads(f.read()) if orjson is not None else json.load(f)
     return Portfolio(
         team=d["team"],
         cash=float(d["cash"]),
@@ -33,3 +73,60 @@ def load_portfolio(state_dir: str, team: str, initial_cash: float) -> Portfolio:
         avg_cost={k: float(v) for k, v in d.get("avg_cost", {}).items()},
         realized_pnl=float(d.get("realized_pnl", 0.0)),
     )
+
+def _write_parquet(df: pd.DataFrame, path: str) -> None:
+    tmp = path + ".tmp"
+    df.to_parquet(tmp, index=False)
+    os.replace(tmp, path)
+
+def has_portfolio_tables(state_dir: str) -> bool:
+    """
+    True once save_all_portfolios has written the state dir. Parquet mode never rewrites
+    the per-team JSON files, so from then on the tables hold the current portfolios.
+    """
+    return os.path.exists(os.path.join(state_dir, ACCOUNTS_TABLE))
+
+def save_all_portfolios(state_dir: str, portfolios: List[Portfolio]) -> None:
+    """
+    Write every team to two Parquet tables: one row per team (cash, realized P&L)
+    and one long (team, ticker) table of holdings. Needs pyarrow.
+    """
+    ensure_dir(state_dir)
+    accounts = pd.DataFrame({
+        "team": [p.team for p in portfolios],
+        "cash": [p.cash for p in portfolios],
+        "realized_pnl": [p.realized_pnl for p in portfolios],
+    })
+    positions = pd.DataFrame({
+        "team": [p.team for p in portfolios for _ in p.positions],
+        "ticker": [sym for p in portfolios for sym in p.positions],
+        "qty": pd.array([q for p in portfolios for q in p.positions.values()], dtype="int64"),
+        "avg_cost": pd.array([p.avg_cost.get(sym, 0.0) for p in portfolios for sym in p.positions], dtype="float64"),
+    })
+    _write_parquet(positions, os.path.join(state_dir, POSITIONS_TABLE))
+    _write_parquet(accounts, os.path.join(state_dir, ACCOUNTS_TABLE))
+
+def load_all_portfolios(state_dir: str) -> Dict[str, Portfolio]:
+    """
+    team -> Portfolio from the tables written by save_all_portfolios ({} if none yet).
+    """
+    accounts_path = os.path.join(state_dir, ACCOUNTS_TABLE)
+    if not os.path.exists(accounts_path):
+        return {}
+    accounts = pd.read_parquet(accounts_path)
+    positions = pd.read_parquet(os.path.join(state_dir, POSITIONS_TABLE))
+
+    out = {
+        team: Portfolio(team=team, cash=float(cash), realized_pnl=float(rpnl))
+        for team, cash, rpnl in zip(
+            accounts["team"].tolist(), accounts["cash"].tolist(), accounts["realized_pnl"].tolist()
+        )
+    }
+    for team, sym, qty, avg in zip(
+        positions["team"].tolist(), positions["ticker"].tolist(),
+        positions["qty"].tolist(), positions["avg_cost"].tolist(),
+    ):
+        p = out[team]
+        p.positions[sym] = int(qty)
+        p.avg_cost[sym] = float(avg)
+    return out
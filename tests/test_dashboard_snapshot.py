@@ -0,0 +1,53 @@
+import json
+
+from simulator.dashboard_snapshot import _tail_lines, build_latest_news_snapshot, build_latest_prices_snapshot
+
+
+def test_tail_lines_across_chunk_boundaries(tmp_path):
+    path = tmp_path / "news.jsonl"
+    path.write_text("".join(json.dumps({"i": i}) + "\n" for i in range(200)), encoding="utf-8")
+
+    for chunk_size in (5, 64, 1 << 16):
+        got = [json.loads(line)["i"] for line in _tail_lines(str(path), 10, chunk_size=chunk_size)]
+        assert got == list(range(190, 200))
+
+    assert len(_tail_lines(str(path), 500)) == 200
+
+
+def test_latest_news_snapshot_keeps_last_items(tmp_path):
+    news = tmp_path / "news.jsonl"
+    news.write_text(
+        "".join(json.dumps({"timestamp": f"2025-01-02 {h:02d}:00:00", "ticker": "AAPL"}) + "\n" for h in range(10, 17)),
+        encoding="utf-8",
+    )
+    out = tmp_path / "latest_news.json"
+    build_latest_news_snapshot(str(news), str(out), limit=3)
+
+    snap = json.loads(out.read_text(encoding="utf-8"))
+    assert snap["timestamp"] == "2025-01-02 16:00:00"
+    assert [x["timestamp"][11:13] for x in snap["items"]] == ["14", "15", "16"]
+
+
+def test_latest_prices_snapshot_changes_and_series(tmp_path):
+    prices = tmp_path / "prices_hourly.csv"
+    prices.write_text(
+        "timestamp,ticker,sector,close,volume\n"
+        "2025-01-02 10:00:00,MSFT,Tech,100.0,10\n"
+        "2025-01-02 10:00:00,AAPL,Tech,50.0,20\n"
+        "2025-01-02 11:00:00,MSFT,Tech,110.0,11\n"
+        "2025-01-02 11:00:00,AAPL,Tech,49.0,21\n"
+        "2025-01-02 12:00:00,MSFT,Tech,99.0,12\n"
+        "2025-01-02 12:00:00,AAPL,Tech,49.0,22\n",
+        encoding="utf-8",
+    )
+    out = tmp_path / "latest_prices.json"
+    build_latest_prices_snapshot(str(prices), str(out), lookback=2)
+
+    snap = json.loads(out.read_text(encoding="utf-8"))
+    assert snap["timestamp"] == "2025-01-02 12:00:00"
+    aapl, msft = snap["rows"]
+    assert aapl["ticker"] == "AAPL" and aapl["chg"] == 0.0 and aapl["volume"] == 22
+    assert msft["chg"] == -11.0
+    assert msft["chg_pct"] == -0.1
+    assert msft["series"] == [110.0, 99.0]
+    assert msft["series_ts"] == ["2025-01-02 11:00:00", "2025-01-02 12:00:00"]
@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from simulator.execution import apply_slippage, apply_slippage_vec
+from simulator.limit_fill import limit_order_fills, limit_order_fills_vec
+
+
+def test_apply_slippage_sides():
+    assert apply_slippage(100.0, "BUY", 5.0) == pytest.approx(100.05)
+    assert apply_slippage(100.0, "sell", 5.0) == pytest.approx(99.95)
+    with pytest.raises(ValueError):
+        apply_slippage(100.0, "HOLD", 5.0)
+
+
+def test_vector_variants_match_scalar():
+    sides = np.array(["BUY", "SELL", "buy", b"SELL"], dtype=object)
+    prices = np.array([10.0, 10.0, 20.0, 20.0])
+    got = apply_slippage_vec(prices, sides, 10.0)
+    assert got.tolist() == [apply_slippage(p, str(s if isinstance(s, str) else s.decode()), 10.0) for p, s in zip(prices, sides)]
+
+    limits = np.array([9.5, 10.5, 9.0, 11.0])
+    highs = np.array([10.6, 10.6, 10.6, 10.6])
+    lows = np.array([9.4, 9.4, 9.4, 9.4])
+    mask = limit_order_fills_vec(["BUY", "SELL", "BUY", "SELL"], limits, highs, lows)
+    assert mask.tolist() == [True, True, False, False]
+    assert mask.tolist() == [limit_order_fills(s, l, 10.6, 9.4) for s, l in zip(["BUY", "SELL", "BUY", "SELL"], limits)]
+
+    with pytest.raises(ValueError):
+        limit_order_fills_vec(["BUY", "HOLD"], limits[:2], highs[:2], lows[:2])
@@ -0,0 +1,42 @@
+import pytest
+
+from simulator.github_issue_parser import _extract_sections, parse_order_from_issue_body
+
+BODY = """### Team name
+team1
+
+### Side
+buy
+
+### Ticker
+aapl
+
+### Quantity (shares)
+10
+
+### Order type
+LIMIT
+
+### Limit price (only if LIMIT)
+150.25
+
+### Notes (optional)
+Testing a limit order.
+"""
+
+
+def test_parse_limit_order():
+    o = parse_order_from_issue_body(BODY)
+    assert (o.team, o.side, o.ticker, o.qty, o.order_type) == ("team1", "BUY", "AAPL", 10, "LIMIT")
+    assert o.limit_price == 150.25
+    assert o.notes == "Testing a limit order."
+
+
+def test_sections_handle_crlf_and_empty_trailing_heading():
+    body = "### Team name\r\nteam2\r\n\r\n### Notes\r\nline one\r\nline two\r\n### Empty"
+    assert _extract_sections(body) == {"team name": "team2", "notes": "line one\nline two", "empty": ""}
+
+
+def test_rejects_ticker_outside_universe():
+    with pytest.raises(ValueError, match="Ticker not in universe"):
+        parse_order_from_issue_body(BODY.replace("aapl", "ZZZZ"))
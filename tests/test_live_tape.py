@@ -0,0 +1,127 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from simulator.live_tape import (
+    BARS_PER_DAY,
+    SECTORS,
+    LiveTapeConfig,
+    load_or_create_state,
+    save_state,
+    step_one_bar,
+)
+
+
+def _cfg(tmp_path):
+    return LiveTapeConfig(
+        state_path=str(tmp_path / "market_state.json"),
+        prices_out=str(tmp_path / "prices_hourly.csv"),
+        news_out=str(tmp_path / "news_hourly.jsonl"),
+        security_master_csv=str(tmp_path / "missing.csv"),
+    )
+
+
+def test_step_one_bar_produces_one_row_per_ticker(tmp_path):
+    cfg = _cfg(tmp_path)
+    state = load_or_create_state(cfg, start_date="2025-01-02")
+    ts, bar_df, news_rows = step_one_bar(cfg, state)
+
+    assert ts == "2025-01-02 10:00:00"
+    assert list(bar_df["ticker"]) == state["universe"]
+    assert (bar_df["high"] >= bar_df[["open", "close"]].max(axis=1)).all()
+    assert (bar_df["low"] <= bar_df[["open", "close"]].min(axis=1)).all()
+    assert (bar_df["volume"] >= 1000).all()
+    assert int(bar_df["has_news"].sum()) == len(news_rows)
+    assert state["current_bar_index"] == 1
+
+
+def test_state_round_trip_continues_the_tape(tmp_path):
+    cfg = _cfg(tmp_path)
+    state = load_or_create_state(cfg, start_date="2025-01-02")
+    for _ in range(BARS_PER_DAY):
+        step_one_bar(cfg, state)
+    save_state(cfg, state)
+
+    with open(cfg.state_path, encoding="utf-8") as f:
+        assert "last_close" not in json.load(f)
+    assert sorted(p.name for p in tmp_path.glob("*.npz")) == ["market_state_arrays.2.npz"]
+
+    reloaded = load_or_create_state(cfg)
+    assert reloaded["current_date"] == "2025-01-03"
+    assert reloaded["current_bar_index"] == 0
+
+    _, bar_df, _ = step_one_bar(cfg, reloaded)
+    _, bar_df_again, _ = step_one_bar(cfg, state)
+    assert bar_df["close"].tolist() == bar_df_again["close"].tolist()
+
+
+def test_legacy_ticker_keyed_state_is_converted(tmp_path):
+    cfg = _cfg(tmp_path)
+    legacy = {
+        "universe": ["AAA", "BBB"],
+        "rng_state": np.random.default_rng(1).bit_generator.state,
+        "sector_name_by_ticker": {"AAA": "Tech", "BBB": "Nope"},
+        "company_name_by_ticker": {"AAA": "Aaa Inc.", "BBB": ""},
+        "market_beta": {"AAA": 1.0, "BBB": 1.2},
+        "sector_beta": {"AAA": 0.5, "BBB": 0.6},
+        "idio_sigma": {"AAA": 0.01, "BBB": 0.02},
+        "base_vol": {"AAA": 2_000_000, "BBB": 3_000_000},
+        "last_close": {"AAA": 10.0, "BBB": 20.0},
+        "current_regime": "bull",
+        "current_date": "2025-01-02",
+        "current_bar_index": 3,
+        "current_macro_headline": None,
+    }
+    with open(cfg.state_path, "w", encoding="utf-8") as f:
+        json.dump(legacy, f)
+
+    state = load_or_create_state(cfg)
+    assert state["ticker_ids"] == {"AAA": 0, "BBB": 1}
+    assert state["sec_idx"].tolist() == [SECTORS.index("Tech"), SECTORS.index("Speculative")]
+    assert state["company_names"] == ["Aaa Inc.", ""]
+    assert state["last_close"].tolist() == [10.0, 20.0]
+
+    _, bar_df, _ = step_one_bar(cfg, state)
+    assert bar_df["sector"].tolist() == ["Tech", "Speculative"]
+
+
+def test_crash_before_json_replace_keeps_json_and_sidecar_paired(tmp_path, monkeypatch):
+    cfg = _cfg(tmp_path)
+    state = load_or_create_state(cfg, start_date="2025-01-02")
+    saved_close = state["last_close"].tolist()
+    step_one_bar(cfg, state)
+
+    real_replace = os.replace
+    def crash_on_json(src, dst):
+        if dst == cfg.state_path:
+            raise OSError("crashed")
+        real_replace(src, dst)
+    monkeypatch.setattr(os, "replace", crash_on_json)
+    with pytest.raises(OSError):
+        save_state(cfg, state)
+    monkeypatch.setattr(os, "replace", real_replace)
+
+    reloaded = load_or_create_state(cfg)
+    assert (reloaded["current_bar_index"], reloaded["last_close"].tolist()) == (0, saved_close)
+
+    save_state(cfg, state)
+    assert sorted(p.name for p in tmp_path.glob("*.npz")) == ["market_state_arrays.2.npz"]
+    assert load_or_create_state(cfg)["last_close"].tolist() == state["last_close"].tolist()
+
+
+def test_unversioned_sidecar_still_loads(tmp_path):
+    cfg = _cfg(tmp_path)
+    state = load_or_create_state(cfg, start_date="2025-01-02")
+    with open(cfg.state_path, encoding="utf-8") as f:
+        small = json.load(f)
+    del small["arrays_generation"]
+    with open(cfg.state_path, "w", encoding="utf-8") as f:
+        json.dump(small, f)
+    os.replace(tmp_path / "market_state_arrays.1.npz", tmp_path / "market_state_arrays.npz")
+
+    reloaded = load_or_create_state(cfg)
+    assert reloaded["last_close"].tolist() == state["last_close"].tolist()
+    save_state(cfg, reloaded)
+    assert sorted(p.name for p in tmp_path.glob("*.npz")) == ["market_state_arrays.1.npz"]
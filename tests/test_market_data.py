@@ -0,0 +1,60 @@
+import pandas as pd
+import pytest
+
+from simulator.market_data import get_day_prices, load_prices
+from simulator.orders import load_orders_csv
+
+
+@pytest.mark.parametrize("fast_io", ["", "1"])
+def test_load_with_date_filters_on_read(tmp_path, monkeypatch, fast_io):
+    if fast_io:
+        pytest.importorskip("pyarrow")
+    monkeypatch.setenv("SIM_FAST_IO", fast_io)
+
+    prices = tmp_path / "prices.csv"
+    pd.DataFrame({
+        "date": ["2025-01-02", "2025-01-02", "2025-01-03"],
+        "ticker": ["aaa", "BBB", "AAA"],
+        "open": [1.0, 2.0, 3.0], "close": [1.5, 2.5, 3.5], "high": [2.0, 3.0, 4.0],
+        "low": [0.5, 1.5, 2.5], "volume": [10, 20, 30],
+    }).to_csv(prices, index=False)
+    day = load_prices(str(prices), date="2025-01-02")
+    assert day["ticker"].tolist() == ["AAA", "BBB"]
+    assert get_day_prices(day, "2025-01-02")["close"].tolist() == [1.5, 2.5]
+    with pytest.raises(ValueError):
+        get_day_prices(load_prices(str(prices), date="2025-01-06"), "2025-01-06")
+
+    orders = tmp_path / "orders.csv"
+    orders.write_text("date,team,ticker,side,qty\n2025-01-02,t1,aaa,buy,5\n2025-01-03,t1,BBB,SELL,2\n")
+    assert [(o.date, o.ticker, o.side, o.qty) for o in load_orders_csv(str(orders), date="2025-01-03")] == [
+        ("2025-01-03", "BBB", "SELL", 2)
+    ]
+    assert len(load_orders_csv(str(orders))) == 2
+
+
+def test_load_news_for_date_matches_full_load(tmp_path):
+    from simulator.market_data import get_day_news, load_news_for_date, load_news_jsonl
+
+    news = tmp_path / "news.jsonl"
+    news.write_text(
+        '{"date": "2025-01-02", "ticker": "AAA", "headline": "up"}\n'
+        '{"date":"2025-01-03","ticker":"BBB","headline":"2025-01-02 recap"}\n'
+        '\n'
+        '{"date":"2025-01-02","ticker":"CCC","headline":"down"}\n'
+    )
+    day = load_news_for_date(str(news), "2025-01-02")
+    assert [n["ticker"] for n in day] == ["AAA", "CCC"]
+    assert day == get_day_news(load_news_jsonl(str(news)), "2025-01-02")
+    assert load_news_for_date(str(tmp_path / "missing.jsonl"), "2025-01-02") == []
+
+
+def test_day_prices_from_frames_not_built_by_load_prices():
+    df = pd.DataFrame({
+        "date": ["2025-01-03", "2025-01-02", "2025-01-02"],
+        "ticker": ["AAA", "AAA", "BBB"],
+        "close": [3.5, 1.5, 2.5],
+    })
+    # sorted string index that is not the date: must filter on the column
+    by_ticker = df.set_index("ticker", drop=False).sort_index()
+    assert get_day_prices(by_ticker, "2025-01-02")["close"].tolist() == [1.5, 2.5]
+    assert get_day_prices(df, "2025-01-03")["close"].tolist() == [3.5]
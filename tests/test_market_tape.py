@@ -0,0 +1,22 @@
+from simulator.market_tape import TapeConfig, generate_market_tape
+
+
+def test_generate_market_tape_shape_and_ohlc():
+    cfg = TapeConfig(start_date="2025-01-01", end_date="2025-03-31", universe=["AAPL", "MSFT", "XOM", "GME"])
+    df, news = generate_market_tape(cfg)
+
+    n_days = df["date"].nunique()
+    assert len(df) == 4 * n_days
+    assert list(df["date"]) == sorted(df["date"])
+    assert (df["high"] >= df[["open", "close"]].max(axis=1)).all()
+    assert (df["low"] <= df[["open", "close"]].min(axis=1)).all()
+    assert (df["volume"] >= 1000).all()
+    assert int(df["has_news"].sum()) == len(news)
+
+
+def test_generate_market_tape_is_deterministic_per_seed():
+    cfg = TapeConfig(start_date="2025-01-01", end_date="2025-02-28", universe=["AAPL", "MSFT"], seed=11)
+    df1, news1 = generate_market_tape(cfg)
+    df2, news2 = generate_market_tape(cfg)
+    assert df1.equals(df2)
+    assert news1 == news2
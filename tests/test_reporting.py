@@ -0,0 +1,70 @@
+import pandas as pd
+
+from simulator.portfolio import Portfolio
+from simulator.reporting import build_pnl_report, build_positions_report
+
+
+# Row-wise reports as first written; the long-frame versions must reproduce them exactly
+def _positions_rowwise(portfolios, close_prices, date):
+    rows = []
+    for p in portfolios:
+        nav = p.nav(close_prices)
+        for sym, qty in p.positions.items():
+            px = close_prices.get(sym, 0.0)
+            mv = qty * px
+            avg = p.avg_cost.get(sym, 0.0)
+            rows.append({
+                "date": date, "team": p.team, "ticker": sym, "qty": qty,
+                "close": round(px, 4), "avg_cost": round(avg, 4), "market_value": round(mv, 2),
+                "weight": round((mv / nav) if nav > 0 else 0.0, 6), "unrealized_pnl": round((px - avg) * qty, 2),
+            })
+    return pd.DataFrame(rows).sort_values(["team", "market_value"], ascending=[True, False])
+
+def _pnl_rowwise(portfolios, close_prices, date, initial_cash):
+    rows = []
+    for p in portfolios:
+        nav = p.nav(close_prices)
+        unreal = 0.0
+        for sym, qty in p.positions.items():
+            unreal += (close_prices.get(sym, 0.0) - p.avg_cost.get(sym, 0.0)) * qty
+        total_pnl = nav - initial_cash
+        rows.append({
+            "date": date, "team": p.team, "nav": round(nav, 2), "cash": round(p.cash, 2),
+            "realized_pnl": round(p.realized_pnl, 2), "unrealized_pnl": round(unreal, 2),
+            "total_pnl": round(total_pnl, 2), "total_return": round(total_pnl / initial_cash, 6),
+        })
+    return pd.DataFrame(rows).sort_values("nav", ascending=False)
+
+def _fixture():
+    close = {"AAA": 12.5, "BBB": 0.1, "CCC": 0.2, "DDD": 0.3, "EEE": 49.53305}
+    return close, [
+        # DataFrame.round gives 2101.06 and 49.533 here; round() gives 2101.07 and 49.5331
+        Portfolio(team="alpha", cash=2101.065, positions={"AAA": 10, "EEE": 3},
+                  avg_cost={"AAA": 11.0, "EEE": 49.53305}, realized_pnl=-12.345),
+        # summed left to right the book is 0.6000000000000001, so nav rounds to 0.61, not 0.6
+        Portfolio(team="bravo", cash=0.005, positions={"BBB": 1, "CCC": 1, "DDD": 1},
+                  avg_cost={"BBB": 0.0, "CCC": 0.0, "DDD": 0.0}),
+        # holding without a close, and a team with no holdings
+        Portfolio(team="charlie", cash=500.0, positions={"ZZZ": 7}, avg_cost={"ZZZ": 3.0}),
+        Portfolio(team="delta", cash=100_000.0),
+    ]
+
+def test_positions_report_matches_rowwise():
+    close, portfolios = _fixture()
+    pd.testing.assert_frame_equal(
+        build_positions_report(portfolios, close, "2025-01-02").reset_index(drop=True),
+        _positions_rowwise(portfolios, close, "2025-01-02").reset_index(drop=True),
+        check_exact=True,
+    )
+
+def test_pnl_report_matches_rowwise():
+    close, portfolios = _fixture()
+    pd.testing.assert_frame_equal(
+        build_pnl_report(portfolios, close, "2025-01-02", 100_000.0).reset_index(drop=True),
+        _pnl_rowwise(portfolios, close, "2025-01-02", 100_000.0).reset_index(drop=True),
+        check_exact=True,
+    )
+
+def test_reports_empty():
+    assert build_positions_report([Portfolio.initial()], {}, "2025-01-02").empty
+    assert build_pnl_report([], {}, "2025-01-02", 100_000.0).empty
@@ -0,0 +1,31 @@
+from simulator.portfolio import Portfolio
+from simulator.risk import RiskConfig, check_order_weight_limit
+
+
+def _portfolio():
+    return Portfolio(team="t", cash=800.0, positions={"AAA": 10, "BBB": 5}, avg_cost={"AAA": 9.0, "BBB": 18.0})
+
+
+def test_weight_limit_accepts_small_order():
+    ok, reason = check_order_weight_limit(_portfolio(), "CCC", "BUY", 1, 10.0, {"AAA": 10.0, "BBB": 20.0}, RiskConfig(0.2))
+    assert (ok, reason) == (True, "OK")
+
+
+def test_weight_limit_names_offending_ticker():
+    prices = {"AAA": 10.0, "BBB": 20.0}
+    assert check_order_weight_limit(_portfolio(), "AAA", "BUY", 20, 10.0, prices, RiskConfig(0.2)) == (
+        False, "POSITION_WEIGHT_LIMIT_AAA")
+    assert check_order_weight_limit(_portfolio(), "NEW", "BUY", 50, 10.0, prices, RiskConfig(0.2)) == (
+        False, "POSITION_WEIGHT_LIMIT_NEW")
+    assert check_order_weight_limit(_portfolio(), "BBB", "SELL", 6, 20.0, prices, RiskConfig(0.2)) == (
+        False, "SHORT_NOT_ALLOWED")
+
+
+def test_uncapped_weight_limit_keeps_order_checks():
+    prices = {"AAA": 10.0, "BBB": 20.0}
+    assert check_order_weight_limit(_portfolio(), "AAA", "BUY", 500, 10.0, prices, RiskConfig(1.0)) == (True, "OK")
+    assert check_order_weight_limit(_portfolio(), "BBB", "SELL", 6, 20.0, prices, RiskConfig(1.0)) == (
+        False, "SHORT_NOT_ALLOWED")
+    broke = Portfolio(team="t", cash=-5.0, positions={"AAA": 1}, avg_cost={"AAA": 9.0})
+    assert check_order_weight_limit(broke, "AAA", "SELL", 1, 1.0, {"AAA": 1.0}, RiskConfig(1.0)) == (
+        False, "NAV_NONPOSITIVE")
@@ -0,0 +1,65 @@
+import pandas as pd
+import pytest
+
+from simulator.run_session import RunArgs, run
+from simulator.state_io import load_all_portfolios, load_portfolio
+
+
+def _write_prices(tmp_path):
+    prices = tmp_path / "prices.csv"
+    pd.DataFrame({
+        "date": ["2025-01-02", "2025-01-02", "2025-01-03", "2025-01-03"],
+        "ticker": ["AAA", "BBB", "AAA", "BBB"],
+        "open": [10.0, 20.0, 10.0, 20.0], "close": [10.0, 20.0, 10.0, 20.0], "high": [11.0, 21.0, 11.0, 21.0],
+        "low": [9.0, 19.0, 9.0, 19.0], "volume": [100, 100, 100, 100],
+    }).to_csv(prices, index=False)
+    return prices
+
+
+def _args(tmp_path, date, orders, **kw):
+    return RunArgs(
+        date=date, prices=str(tmp_path / "prices.csv"), news=str(tmp_path / "news.jsonl"), orders=str(orders),
+        state_dir=str(tmp_path / "state"), out_dir=str(tmp_path / "out"), reports_dir=str(tmp_path / "rep"),
+        initial_cash=1000.0, fee=0.0, slippage_bps=0.0, max_pos_w=1.0, **kw,
+    )
+
+
+def test_run_executes_one_day_without_argparse(tmp_path):
+    _write_prices(tmp_path)
+    orders = tmp_path / "orders.csv"
+    orders.write_text(
+        "date,team,ticker,side,qty\n"
+        "2025-01-02,t1,AAA,BUY,10\n"
+        "2025-01-02,t1,ZZZ,BUY,1\n"
+        "2025-01-02,t2,BBB,SELL,1\n"
+        "2025-01-03,t1,AAA,BUY,10\n"
+    )
+    run(_args(tmp_path, "2025-01-02", orders))
+
+    assert load_portfolio(str(tmp_path / "state"), "t1", 0.0).positions == {"AAA": 10}
+    trades = pd.read_csv(tmp_path / "out" / "trades_2025-01-02.csv")
+    assert trades["status"].tolist() == ["FILLED", "REJECT_NO_PRICE", "REJECT_SHORT_NOT_ALLOWED"]
+    lb = pd.read_csv(tmp_path / "out" / "leaderboard.csv")
+    assert dict(zip(lb["team"], lb["nav"])) == {"t1": 1000.0, "t2": 1000.0}
+
+
+def test_switching_json_state_to_parquet_keeps_portfolios(tmp_path):
+    pytest.importorskip("pyarrow")
+    _write_prices(tmp_path)
+    orders = tmp_path / "orders.csv"
+    orders.write_text(
+        "date,team,ticker,side,qty\n"
+        "2025-01-02,t1,AAA,BUY,10\n"
+        "2025-01-02,t2,BBB,BUY,5\n"
+        "2025-01-03,t2,BBB,SELL,2\n"
+    )
+    run(_args(tmp_path, "2025-01-02", orders))
+    run(_args(tmp_path, "2025-01-03", orders, state_format="parquet"))
+
+    stored = load_all_portfolios(str(tmp_path / "state"))
+    assert stored["t1"].positions == {"AAA": 10} and stored["t1"].cash == 900.0
+    assert stored["t2"].positions == {"BBB": 3} and stored["t2"].cash == 940.0
+
+    # the JSON files stopped at the first day; json mode must not silently use them
+    with pytest.raises(ValueError, match="parquet"):
+        run(_args(tmp_path, "2025-01-03", orders))
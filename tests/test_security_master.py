@@ -0,0 +1,24 @@
+import pandas as pd
+import pytest
+
+import simulator.security_master as security_master
+from simulator.security_master import SecurityMaster
+
+
+@pytest.mark.parametrize("backend", ["numpy_nullable", "pyarrow"])
+def test_missing_employee_count_loads_as_none(tmp_path, monkeypatch, backend):
+    if backend == "pyarrow":
+        pytest.importorskip("pyarrow")
+    # nullable/arrow-backed frames (as from the SIM_FAST_IO readers) hold pd.NA, not NaN
+    monkeypatch.setattr(security_master, "read_csv", lambda p: pd.read_csv(p, dtype_backend=backend))
+
+    csv = tmp_path / "master.csv"
+    csv.write_text(
+        "symbol,companyName,industry,sector,description,fullTimeEmployees,country\n"
+        "aaa,Alpha Inc,Software,Tech,Makes things,1200,US\n"
+        "BBB,Beta Corp,,Financials,,,\n"
+    )
+    sm = SecurityMaster(csv)
+    a, b = sm.get("AAA"), sm.get("bbb")
+    assert (a.full_time_employees, a.description, a.sector) == (1200, "Makes things", "Tech")
+    assert (b.full_time_employees, b.description, b.industry, b.country) == (None, None, "Unknown", "Unknown")
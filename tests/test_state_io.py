@@ -0,0 +1,61 @@
+import os
+
+import pytest
+
+from simulator.portfolio import Portfolio
+from simulator.state_io import (
+    list_portfolio_teams,
+    load_all_portfolios,
+    load_portfolio,
+    save_all_portfolios,
+    save_portfolio,
+)
+
+
+def test_list_portfolio_teams_follows_files_on_disk(tmp_path):
+    state_dir = str(tmp_path)
+    assert list_portfolio_teams(str(tmp_path / "missing")) == []
+    save_portfolio(state_dir, Portfolio(team="b", cash=1.0))
+    save_portfolio(state_dir, Portfolio(team="a", cash=2.0, positions={"AAPL": 3}, avg_cost={"AAPL": 10.0}))
+    save_portfolio(state_dir, Portfolio(team="a", cash=3.0))
+    (tmp_path / "market_state.json").write_text("{}")
+    (tmp_path / "portfolio_c.json.tmp").write_text("{}")
+    (tmp_path / "portfolio_d.json").mkdir()
+    assert list_portfolio_teams(state_dir) == ["a", "b"]
+    assert load_portfolio(state_dir, "a", 100.0).cash == 3.0
+
+    # Files removed or added by hand show up on the next listing
+    os.remove(os.path.join(state_dir, "portfolio_b.json"))
+    save_portfolio(str(tmp_path / "elsewhere"), Portfolio(team="c", cash=3.0))
+    os.replace(str(tmp_path / "elsewhere" / "portfolio_c.json"), os.path.join(state_dir, "portfolio_c.json"))
+    assert list_portfolio_teams(state_dir) == ["a", "c"]
+
+
+def test_all_portfolios_parquet_round_trip(tmp_path):
+    pytest.importorskip("pyarrow")
+    state_dir = str(tmp_path)
+    assert load_all_portfolios(state_dir) == {}
+
+    ports = [
+        Portfolio(team="a", cash=10.5, positions={"AAPL": 3, "MSFT": 1}, avg_cost={"AAPL": 1.25, "MSFT": 2.0},
+                  realized_pnl=-4.0),
+        Portfolio(team="b", cash=7.0),
+    ]
+    save_all_portfolios(state_dir, ports)
+    assert load_all_portfolios(state_dir) == {p.team: p for p in ports}
+
+
+def test_save_portfolio_is_atomic_and_skips_unchanged(tmp_path):
+    state_dir = str(tmp_path)
+    p = Portfolio(team="a", cash=5.0, positions={"AAPL": 1}, avg_cost={"AAPL": 2.0})
+    save_portfolio(state_dir, p)
+    path = tmp_path / "portfolio_a.json"
+    os.utime(path, (0, 0))
+
+    save_portfolio(state_dir, p)
+    assert path.stat().st_mtime == 0
+
+    p.cash = 6.0
+    save_portfolio(state_dir, p)
+    assert load_portfolio(state_dir, "a", 100.0) == p
+    assert os.listdir(state_dir) == ["portfolio_a.json"]